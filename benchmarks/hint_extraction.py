@@ -0,0 +1,77 @@
+"""Benchmark the plugins' HTML hint extractors with and without the raw-markup scan.
+
+Run from the repository root::
+
+    python -m benchmarks.hint_extraction
+
+The bodies are the fixtures from ``tests/fixtures/announcements``. Each one is
+padded with description paragraphs to the tens of kilobytes a live
+announcement carries. The soup column runs the same extractors on documents
+marked as not simple, which makes every lookup use its BeautifulSoup path.
+"""
+
+from __future__ import annotations
+
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+
+from games import genshin, starrail, zenless
+from parsers.document import AnnouncementDocument
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "announcements"
+_FILLER = "<p>" + "活动期间，参与玩法即可获得丰厚奖励，详情请查看活动页面说明。" * 40 + "</p>"
+
+
+def _genshin(document: AnnouncementDocument) -> object:
+    return genshin._event_time_hints(document), genshin._gacha_time_hints(document)
+
+
+def _starrail(document: AnnouncementDocument) -> object:
+    return starrail._format_gacha_title("跃迁", None, document)
+
+
+def _zenless(document: AnnouncementDocument) -> object:
+    return (
+        zenless._event_time_hints(document),
+        zenless._gacha_time_hints(document),
+        zenless._gacha_banner(SimpleNamespace(banner=""), None, document),
+    )
+
+
+PLUGINS = {"genshin": _genshin, "starrail": _starrail, "zenless": _zenless}
+
+
+def _document(html: str, *, soup: bool) -> AnnouncementDocument:
+    document = AnnouncementDocument(html)
+    if soup:
+        document._simple = False
+    return document
+
+
+def main() -> None:
+    for game, extract in PLUGINS.items():
+        bodies = [
+            path.read_text(encoding="utf-8") + _FILLER * 15
+            for path in sorted(FIXTURES.glob(f"{game}_*.html"))
+        ]
+        fast = [extract(_document(html, soup=False)) for html in bodies]
+        assert fast == [extract(_document(html, soup=True)) for html in bodies], game
+        timings = [
+            min(
+                timeit.repeat(
+                    lambda: [extract(_document(html, soup=soup)) for html in bodies],
+                    number=3,
+                    repeat=3,
+                )
+            )
+            / 3
+            * 1e3
+            for soup in (True, False)
+        ]
+        size = sum(map(len, bodies)) // 1024
+        print(f"{game:9} {len(bodies)} bodies, {size:4} KiB: soup {timings[0]:6.2f} ms -> scan {timings[1]:5.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Micro-benchmark the precompiled pattern registry in ``parsers.patterns``.
+
+Run from the repository root::
+
+    python -m benchmarks.text_patterns
+
+Every version name, announcement title and description in the bundled
+``data/*/data.json`` files goes through the text helpers and the genshin
+title formatters. The ``_inline_*`` references reproduce the previous
+helpers, which compiled their pattern per call or handed raw pattern
+strings to ``re``; their outputs are asserted equal before timing.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import timeit
+from pathlib import Path
+
+from games import genshin
+from parsers import text
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def _inline_remove_html_tags(value: str) -> str:
+    clean = re.compile(r"<.*?>")
+    return re.sub(clean, "", value).strip()
+
+
+def _inline_extract_floats(value: str) -> list[float]:
+    return [float(number) for number in re.findall(r"-?\d+\.\d+", value)]
+
+
+def _inline_extract_inner_text(value: str) -> str:
+    match = re.search(r"(?<=「)[^」]*(?=」)", value)
+    return match.group(0) if match else ""
+
+
+def _inline_extract_weapon_names(title: str) -> list[str]:
+    import re
+
+    return re.findall(r"「[^」]*·([^」]*)」", title)
+
+
+def _inline_format_collection_gacha(title: str) -> str:
+    import re
+
+    match = re.search(r"「([^」]+)」祈愿", title)
+    if match:
+        return f"「{match.group(1)}」集录祈愿"
+    return title
+
+
+def _inline_format_character_gacha(title: str) -> str:
+    import re
+
+    name_match = re.search(r"·(.*)\(", title)
+    gacha_match = re.search(r"「([^」]+)」祈愿", title)
+    if name_match and gacha_match:
+        return f"「{gacha_match.group(1)}」角色祈愿: {name_match.group(1)}"
+    return title
+
+
+CASES = [
+    ("remove_html_tags", _inline_remove_html_tags, text.remove_html_tags),
+    ("extract_floats", _inline_extract_floats, text.extract_floats),
+    ("extract_inner_text", _inline_extract_inner_text, text.extract_inner_text),
+    ("_extract_weapon_names", _inline_extract_weapon_names, genshin._extract_weapon_names),
+    ("_format_collection_gacha", _inline_format_collection_gacha, genshin._format_collection_gacha),
+    ("_format_character_gacha", _inline_format_character_gacha, genshin._format_character_gacha),
+]
+
+
+def _strings() -> list[str]:
+    strings: list[str] = []
+    for path in sorted(DATA_DIR.glob("*/data.json")):
+        for version in json.loads(path.read_text(encoding="utf-8"))["version_list"]:
+            strings.append(version["name"])
+            for item in version["ann_list"]:
+                strings += [item["title"], item["description"]]
+    return strings
+
+
+def _best(fn, strings: list[str]) -> float:
+    return min(timeit.repeat(lambda: [fn(value) for value in strings], number=20, repeat=5)) / 20 * 1e3
+
+
+def main() -> None:
+    strings = _strings()
+    print(f"{len(strings)} strings from the bundled data")
+    for name, inline, registry in CASES:
+        assert [inline(value) for value in strings] == [registry(value) for value in strings], name
+        before, after = _best(inline, strings), _best(registry, strings)
+        print(f"{name:26} {before:.3f} ms -> {after:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
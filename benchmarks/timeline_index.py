@@ -0,0 +1,99 @@
+"""Benchmark the indexed ``GameTimeline`` against the linear scans it replaced.
+
+Run from the repository root::
+
+    python -m benchmarks.timeline_index
+
+A synthetic single-version timeline receives ``n`` announcements whose ids
+are drawn from ``2n``, so about a fifth are duplicates. Then 50
+``find_version`` calls run over 51 versions. The linear reference functions
+reproduce the pre-index behaviour: an ``any(...)`` scan per upsert and two
+list scans per lookup.
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+from datetime import datetime, timedelta
+
+from models.game import Announcement, GameTimeline, GameVersion
+
+
+def _announcements(count: int, seed: int = 1) -> list[Announcement]:
+    rng = random.Random(seed)
+    base = datetime(2026, 1, 1)
+    return [
+        Announcement(
+            id=rng.randint(1, count * 2),
+            title=f"活动 {index}",
+            description="",
+            game="原神",
+            category="event",
+            start_time=base + timedelta(hours=index),
+        )
+        for index in range(count)
+    ]
+
+
+def _linear_inject(version: GameVersion, announcements: list[Announcement]) -> None:
+    for announcement in announcements:
+        if any(item.id == announcement.id for item in version.announcements):
+            continue
+        version.announcements.append(announcement)
+
+
+def _linear_find(versions: list[GameVersion], *, code: str, name: str) -> GameVersion | None:
+    for version in versions:
+        if version.name == name:
+            return version
+    for version in versions:
+        if version.code == code:
+            return version
+    return None
+
+
+def _timeline_with_versions(announcements: list[Announcement]) -> GameTimeline:
+    timeline = GameTimeline()
+    timeline.inject_announcements(code="5.3", announcements=announcements)
+    for number in range(50):
+        timeline.upsert_version(code=f"{number}.0", name=f"v{number}")
+    return timeline
+
+
+def main() -> None:
+    for count in (1_000, 10_000):
+        announcements = _announcements(count)
+
+        def indexed_inject() -> None:
+            GameTimeline().inject_announcements(code="5.3", announcements=announcements)
+
+        def linear_inject() -> None:
+            _linear_inject(GameVersion(name="", code="5.3"), announcements)
+
+        repeat = 1 if count > 1_000 else 3
+        indexed = min(timeit.repeat(indexed_inject, number=1, repeat=3))
+        linear = min(timeit.repeat(linear_inject, number=1, repeat=repeat))
+        print(f"inject {count:>6} anns   linear {linear * 1e3:9.1f} ms  indexed {indexed * 1e3:7.1f} ms")
+
+    timeline = _timeline_with_versions(_announcements(1_000))
+    codes = [(f"{number}.0", f"missing{number}") for number in range(50)]
+    indexed = min(
+        timeit.repeat(
+            lambda: [timeline.find_version(code=code, name=name) for code, name in codes],
+            number=100,
+            repeat=3,
+        )
+    )
+    linear = min(
+        timeit.repeat(
+            lambda: [_linear_find(timeline.version_list, code=code, name=name) for code, name in codes],
+            number=100,
+            repeat=3,
+        )
+    )
+    print(f"50 find_version (51 versions)  linear {linear * 10:6.3f} ms  indexed {indexed * 10:6.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Benchmark the slotted timeline records on a synthetic 50k-event history.
+
+Run from the repository root::
+
+    python -m benchmarks.timeline_records
+
+Writes a ``data.json`` with 50 versions of 1,000 announcements each to a
+temporary directory. The file is loaded into the slotted ``models.game``
+records through ``services.storage``, and into ``_PydanticTimeline``, a copy
+of the pydantic models those records replaced. The script reports the resident
+size of each, pickle and attribute-walk throughput, and a load/save round
+trip through ``services.storage``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import json
+import pickle
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from loguru import logger
+
+from services import storage
+
+EVENTS = 50_000
+VERSIONS = 50
+
+
+class _PydanticAnnouncement(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: int
+    title: str
+    description: str
+    game: str
+    start_time: datetime
+    end_time: datetime | None = None
+    banner: str = ""
+    category: str = Field(alias="ann_type")
+
+
+class _PydanticVersion(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    name: str
+    code: str
+    banner: str = ""
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    special_program_time: datetime | None = Field(default=None, alias="sp_time")
+    announcements: list[_PydanticAnnouncement] = Field(default_factory=list, alias="ann_list")
+
+
+class _PydanticTimeline(BaseModel):
+    version_list: list[_PydanticVersion] = Field(default_factory=list)
+
+
+def _history() -> dict:
+    rng = random.Random(7)
+    now = datetime(2026, 10, 1)
+    versions = []
+    for number in range(VERSIONS):
+        announcements = []
+        for index in range(EVENTS // VERSIONS):
+            start = now + timedelta(days=rng.uniform(-5, 60), seconds=rng.randrange(86400))
+            end = start + timedelta(days=rng.uniform(1, 40)) if rng.random() > 0.05 else None
+            announcements.append({
+                "id": number * 10**6 + index,
+                "title": f"「活动{index}」限时活动说明",
+                "description": "参与活动获取奖励",
+                "game": "原神",
+                "start_time": start.replace(microsecond=0).isoformat(),
+                "end_time": end.replace(microsecond=0).isoformat() if end else None,
+                "banner": f"https://example.invalid/banner/{number}/{index}.png",
+                "ann_type": rng.choice(["event", "gacha"]),
+                "fingerprint": "",
+            })
+        versions.append({
+            "name": f"版本{number}",
+            "code": f"{number // 10 + 1}.{number % 10}",
+            "banner": "",
+            "start_time": (now + timedelta(days=number)).isoformat(),
+            "end_time": (now + timedelta(days=number + 42)).isoformat(),
+            "sp_time": None,
+            "ann_list": announcements,
+        })
+    return {"version_list": versions}
+
+
+def _best(fn, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1e3
+
+
+def _resident(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def _records(timeline) -> list:
+    return [item for version in timeline.version_list for item in version.announcements]
+
+
+def main() -> None:
+    logger.remove()
+    base_dir = Path(tempfile.mkdtemp())
+    (base_dir / "source").mkdir()
+    source = base_dir / "source" / "data.json"
+    source.write_text(json.dumps(_history(), ensure_ascii=False), encoding="utf-8")
+    content = source.read_bytes()
+
+    models, pydantic_size = _resident(lambda: _PydanticTimeline.model_validate_json(content))
+    timeline, slotted_size = _resident(lambda: asyncio.run(storage.load_timeline(base_dir, "source")))
+    print(f"{EVENTS} events in {VERSIONS} versions")
+    for label, size in (("pydantic", pydantic_size), ("slotted", slotted_size)):
+        print(f"{label:9} resident timeline {size / 2**20:5.1f} MiB ({size / EVENTS:.0f} B/event)")
+    for label, records in (("pydantic", _records(models)), ("slotted", _records(timeline))):
+        round_trip = _best(lambda: pickle.loads(pickle.dumps(records)), repeat=3)
+        walk = _best(lambda: [(r.category, r.title, r.start_time, r.end_time) for r in records])
+        print(f"{label:9} pickle round trip {round_trip:7.1f} ms  attribute walk {walk:6.2f} ms")
+
+    load = _best(lambda: asyncio.run(storage.load_timeline(base_dir, "source")))
+    save = _best(lambda: asyncio.run(storage.save_timeline(base_dir, "copy", timeline)))
+    same = (base_dir / "copy" / "data.json").read_bytes() == content
+    print(f"storage load {load:.1f} ms  save {save:.1f} ms  round trip identical: {same}")
+
+
+if __name__ == "__main__":
+    main()
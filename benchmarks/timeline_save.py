@@ -0,0 +1,93 @@
+"""Benchmark ``save_timeline``'s serialiser against pydantic's ``dump_json``.
+
+Run from the repository root::
+
+    python -m benchmarks.timeline_save
+
+``data.json`` must keep ``json.dumps``' ``", "`` and ``": "`` separators.
+``dump_json`` only writes compact JSON, so the candidate re-inserts the
+spaces afterwards. The spaces go after every ``"key":`` of the payload schema
+and after each comma that directly precedes a key or an object, which an
+unescaped quote makes unambiguous. Both outputs are asserted byte-identical
+before timing (best of 5).
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import timeit
+from datetime import datetime, timedelta
+
+from models.game import Announcement, GameTimeline, GameVersion
+from services.storage import (
+    _TIMELINE_ADAPTER,
+    _AnnouncementPayload,
+    _TimelinePayload,
+    _VersionPayload,
+    _timeline_to_payload,
+)
+
+_KEYS = b"|".join(
+    re.escape(key).encode("utf-8")
+    for payload in (_TimelinePayload, _VersionPayload, _AnnouncementPayload)
+    for key in sorted(payload.__required_keys__ | payload.__optional_keys__)
+)
+_KEY_COLON = re.compile(rb'"(' + _KEYS + rb')":')
+_ITEM_COMMA = re.compile(rb',(?=\{?"(?:' + _KEYS + rb')": )')
+
+
+def _timeline(count: int) -> GameTimeline:
+    rng = random.Random(count)
+    now = datetime(2026, 10, 1)
+    versions = []
+    for number in range(max(1, count // 1_000)):
+        version = GameVersion(name=f"版本{number}", code=f"{number // 10 + 1}.{number % 10}")
+        version.start_time = now + timedelta(days=number)
+        for index in range(min(count, 1_000)):
+            start = now + timedelta(days=rng.uniform(-5, 60), seconds=rng.randrange(86400))
+            version.announcements.append(
+                Announcement(
+                    id=number * 10**6 + index,
+                    title=f"「活动{index}」限时活动：说明, \"引号\"",
+                    description="参与活动获取奖励",
+                    game="原神",
+                    category=rng.choice(["event", "gacha"]),
+                    start_time=start.replace(microsecond=0),
+                    end_time=start.replace(microsecond=0) + timedelta(days=14) if index % 20 else None,
+                    banner=f"https://example.invalid/banner/{number}/{index}.png",
+                )
+            )
+        versions.append(version)
+    return GameTimeline(version_list=versions)
+
+
+def _json_dumps(payload) -> bytes:
+    return json.dumps(
+        _TIMELINE_ADAPTER.dump_python(payload, mode="json"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def _dump_json(payload) -> bytes:
+    return _TIMELINE_ADAPTER.dump_json(payload)
+
+
+def _dump_json_spaced(payload) -> bytes:
+    return _ITEM_COMMA.sub(b", ", _KEY_COLON.sub(rb'"\1": ', _TIMELINE_ADAPTER.dump_json(payload)))
+
+
+def main() -> None:
+    print(f"{'announcements':>13}  json.dumps  dump_json (compact)  dump_json + spacing")
+    for count in (100, 1_000, 10_000, 100_000):
+        payload = _timeline_to_payload(_timeline(count))
+        assert _json_dumps(payload) == _dump_json_spaced(payload), count
+        timings = [
+            min(timeit.repeat(lambda: serialise(payload), number=1, repeat=5)) * 1e3
+            for serialise in (_json_dumps, _dump_json, _dump_json_spaced)
+        ]
+        print(f"{count:>13}  {timings[0]:7.1f} ms  {timings[1]:16.1f} ms  {timings[2]:16.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 """HTTP clients used by the hoyo_calendar pipeline."""
 
+from .cache import ResponseCache
 from .hoyolab import HoyolabClient
 from .miyoushe import MiyousheClient
+from .transport import HttpTransport
 
-__all__ = ["HoyolabClient", "MiyousheClient"]
+__all__ = ["HoyolabClient", "HttpTransport", "MiyousheClient", "ResponseCache"]
@@ -0,0 +1,213 @@
+"""On-disk conditional-GET cache shared by the API clients."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping, TypeVar
+
+import httpx
+from loguru import logger
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from .transport import HttpTransport
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# ``{key}.model`` beside the body: a pickle of the validated DTO headed by a
+# digest of the model's schema and of the body it was validated from, so a
+# changed payload or DTO never resurrects a stale object.
+_MODEL_MAGIC = b"HMC1"
+_DIGEST_SIZE = hashlib.sha256().digest_size
+_MODEL_HEADER_SIZE = len(_MODEL_MAGIC) + 2 * _DIGEST_SIZE
+
+_schema_digests: dict[type[BaseModel], bytes] = {}
+
+
+@dataclass(slots=True)
+class CachedEntry:
+    """Validators and body stored for a previously fetched URL."""
+
+    etag: str | None
+    last_modified: str | None
+    body: bytes
+
+
+class ResponseCache:
+    """Store response bodies with ETag/Last-Modified validators on disk.
+
+    Requests carry ``If-None-Match``/``If-Modified-Since`` when an entry exists;
+    a ``304`` answer reuses the stored body instead of downloading it again,
+    and :meth:`get_model` also reuses the DTO validated from that body.
+    """
+
+    def __init__(self, directory: Path | None) -> None:
+        self._directory = directory
+        self.hits = 0
+        self.misses = 0
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return self._directory is not None
+
+    @staticmethod
+    def cache_key(url: str, params: Mapping[str, Any] | None = None) -> str:
+        normalized = json.dumps(
+            [url, sorted((str(key), str(value)) for key, value in (params or {}).items())],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    async def get(
+        self,
+        transport: HttpTransport,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> bytes:
+        """Issue a (conditional) GET and return the body to use."""
+
+        _, body = await self._fetch(transport, url, params=params, headers=headers)
+        return body
+
+    async def get_model(
+        self,
+        transport: HttpTransport,
+        url: str,
+        model: type[ModelT],
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> ModelT:
+        """Like :meth:`get`, but return the body validated as ``model``."""
+
+        key, body = await self._fetch(transport, url, params=params, headers=headers)
+        digest = _model_digest(model, body)
+        value = self._load_model(key, digest, model)
+        if value is None:
+            value = model.model_validate_json(body)
+            self._store_model(key, digest, value)
+        return value
+
+    async def _fetch(
+        self,
+        transport: HttpTransport,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None,
+        headers: Mapping[str, str] | None,
+    ) -> tuple[str, bytes]:
+        key = self.cache_key(url, params)
+        entry = self._load_entry(key)
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.etag:
+                request_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request_headers["If-Modified-Since"] = entry.last_modified
+
+        response = await transport.get(url, params=params, headers=request_headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED and entry is not None:
+            self.hits += 1
+            logger.debug("HTTP cache hit for {url}", url=url)
+            return key, entry.body
+
+        response.raise_for_status()
+        self.misses += 1
+        self._store_entry(key, response)
+        return key, response.content
+
+    def summary(self) -> str:
+        return f"{self.hits} hit(s), {self.misses} miss(es)"
+
+    def _load_entry(self, key: str) -> CachedEntry | None:
+        if self._directory is None:
+            return None
+        meta_path = self._directory / f"{key}.json"
+        body_path = self._directory / f"{key}.body"
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        return CachedEntry(
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            body=body,
+        )
+
+    def _load_model(self, key: str, digest: bytes, model: type[ModelT]) -> ModelT | None:
+        if self._directory is None:
+            return None
+        path = self._directory / f"{key}.model"
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        checksum = data[len(_MODEL_MAGIC) + _DIGEST_SIZE : _MODEL_HEADER_SIZE]
+        payload = data[_MODEL_HEADER_SIZE:]
+        if data[: len(_MODEL_MAGIC) + _DIGEST_SIZE] != _MODEL_MAGIC + digest:
+            return None
+        try:
+            if checksum != hashlib.sha256(payload).digest():
+                raise ValueError("checksum mismatch")
+            value = pickle.loads(payload)
+        except Exception as exc:  # truncated or corrupt file, foreign pickle, ...
+            logger.debug("Discarding decoded cache entry {key}: {error}", key=key, error=exc)
+            path.unlink(missing_ok=True)
+            return None
+        return value if type(value) is model else None
+
+    def _store_model(self, key: str, digest: bytes, value: BaseModel) -> None:
+        if self._directory is None or not (self._directory / f"{key}.json").exists():
+            return
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        _atomic_write(
+            self._directory / f"{key}.model",
+            _MODEL_MAGIC + digest + hashlib.sha256(payload).digest() + payload,
+        )
+
+    def _store_entry(self, key: str, response: httpx.Response) -> None:
+        if self._directory is None:
+            return
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            for suffix in ("json", "body", "model"):
+                (self._directory / f"{key}.{suffix}").unlink(missing_ok=True)
+            return
+        _atomic_write(self._directory / f"{key}.body", response.content)
+        _atomic_write(
+            self._directory / f"{key}.json",
+            json.dumps(
+                {"url": str(response.url), "etag": etag, "last_modified": last_modified},
+                ensure_ascii=False,
+            ).encode("utf-8"),
+        )
+
+
+def _model_digest(model: type[BaseModel], body: bytes) -> bytes:
+    schema = _schema_digests.get(model)
+    if schema is None:
+        layout = [model.__module__, model.__qualname__, model.model_json_schema()]
+        schema = hashlib.sha256(json.dumps(layout, sort_keys=True).encode("utf-8")).digest()
+        _schema_digests[model] = schema
+    digest = hashlib.sha256(schema)
+    digest.update(body)
+    return digest.digest()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
+from typing import TypeVar
 
-import httpx
 from loguru import logger
+from pydantic import BaseModel
 
 from models.config import GameConfig
-from dto import AnnContentRe, AnnListRe
+from dto import AnnContentRe, AnnListRe, SlimAnnContentRe, SlimAnnListRe
 from settings import Settings
+from .cache import ResponseCache
+from .resilience import ResilientRequester
+from .transport import HttpTransport
 
 HEADERS = {
     "User-Agent": (
@@ -21,46 +23,64 @@ HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8",
     "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
     "Accept-Encoding": "gzip, deflate, br",
-    "Connection": "keep-alive",
 }
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 class HoyolabClient:
-    """Thin wrapper around ``httpx.AsyncClient`` with optional mock support."""
+    """Thin wrapper around the shared ``HttpTransport`` with optional mock support."""
 
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        transport: HttpTransport | None = None,
+        cache: ResponseCache | None = None,
+    ):
         self._settings = settings
-        self._client = httpx.AsyncClient(timeout=settings.http_timeout_seconds, headers=HEADERS)
+        self._cache = cache or ResponseCache(None)
+        self._requester = ResilientRequester(settings)
+        self._owns_transport = transport is None
+        self._transport = transport or HttpTransport(settings)
 
     async def __aenter__(self) -> "HoyolabClient":
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
-        await self._client.aclose()
+        if self._owns_transport:
+            await self._transport.aclose()
 
-    async def fetch_ann_list(self, config: GameConfig) -> AnnListRe:
-        payload = await self._get(
+    async def fetch_ann_list(self, config: GameConfig) -> SlimAnnListRe:
+        return await self._get(
             url=config.ann_list_url,
             game_id=config.game_id,
             mock_filename="ann_list.json",
+            model=AnnListRe if self._settings.strict_payload_validation else SlimAnnListRe,
         )
-        return AnnListRe.model_validate(payload)
 
-    async def fetch_ann_content(self, config: GameConfig) -> AnnContentRe:
-        payload = await self._get(
+    async def fetch_ann_content(self, config: GameConfig) -> SlimAnnContentRe:
+        return await self._get(
             url=config.ann_content_url,
             game_id=config.game_id,
             mock_filename="ann_content.json",
+            model=AnnContentRe if self._settings.strict_payload_validation else SlimAnnContentRe,
         )
-        return AnnContentRe.model_validate(payload)
 
-    async def _get(self, *, url: str, game_id: str, mock_filename: str) -> Any:
+    async def _get(
+        self,
+        *,
+        url: str,
+        game_id: str,
+        mock_filename: str,
+        model: type[ModelT],
+    ) -> ModelT:
         if self._settings.enable_debug_mocks:
             mock_path = self._settings.debug_data_dir / game_id / mock_filename
             logger.debug("Using mock data for {game}: {path}", game=game_id, path=mock_path)
-            with mock_path.open("r", encoding="utf-8") as handle:
-                return json.load(handle)
+            return model.model_validate_json(mock_path.read_bytes())
 
-        response = await self._client.get(url)
-        response.raise_for_status()
-        return response.json()
+        return await self._requester.run(
+            url,
+            lambda: self._cache.get_model(self._transport, url, model, headers=HEADERS),
+        )
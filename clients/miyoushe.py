@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from typing import Any
 
 import httpx
 from loguru import logger
 
 from settings import Settings
+from .cache import ResponseCache
+from .transport import HttpTransport
 
 HEADERS = {
     "User-Agent": (
@@ -28,14 +31,23 @@ class MiyousheClient:
     _NEWS_URL = "https://bbs-api-static.miyoushe.com/painter/wapi/getNewsList"
     _POST_URL = "https://bbs-api.miyoushe.com/post/wapi/getPostFull"
 
-    def __init__(self, settings: Settings):
-        self._client = httpx.AsyncClient(timeout=settings.http_timeout_seconds, headers=HEADERS)
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        transport: HttpTransport | None = None,
+        cache: ResponseCache | None = None,
+    ):
+        self._cache = cache or ResponseCache(None)
+        self._owns_transport = transport is None
+        self._transport = transport or HttpTransport(settings)
 
     async def __aenter__(self) -> "MiyousheClient":
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
-        await self._client.aclose()
+        if self._owns_transport:
+            await self._transport.aclose()
 
     async def fetch_news_list(
         self,
@@ -81,9 +93,13 @@ class MiyousheClient:
         last_error: Exception | None = None
         while attempt < retries:
             try:
-                response = await self._client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()
+                body = await self._cache.get(
+                    self._transport,
+                    url,
+                    params=params,
+                    headers=HEADERS,
+                )
+                return json.loads(body)
             except httpx.RequestError as exc:  # includes timeouts, network issues
                 last_error = exc
                 attempt += 1
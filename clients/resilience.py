@@ -0,0 +1,203 @@
+"""Retry, circuit-breaker and request-hedging helpers for the API clients."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+
+import httpx
+from loguru import logger
+
+from settings import Settings
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a host's circuit is open and requests are short-circuited."""
+
+
+class CircuitBreaker:
+    """Per-host breaker that opens after consecutive failures.
+
+    Once the cool-down has passed the circuit is half-open: :meth:`allow`
+    admits a single probe and rejects every other caller until that probe
+    is recorded as a success or failure, or released.
+    """
+
+    def __init__(self, *, failure_threshold: int, reset_seconds: float) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+        self._probing: set[str] = set()
+
+    def allow(self, host: str) -> bool:
+        opened_at = self._opened_at.get(host)
+        if opened_at is None:
+            return True
+        if host in self._probing or time.monotonic() - opened_at < self._reset_seconds:
+            return False
+        self._probing.add(host)
+        return True
+
+    def probing(self, host: str) -> bool:
+        return host in self._probing
+
+    def release(self, host: str) -> None:
+        """Give up the half-open probe without recording an outcome."""
+
+        self._probing.discard(host)
+
+    def record_success(self, host: str) -> None:
+        self._failures.pop(host, None)
+        self._opened_at.pop(host, None)
+        self._probing.discard(host)
+
+    def record_failure(self, host: str) -> None:
+        self._probing.discard(host)
+        failures = self._failures.get(host, 0) + 1
+        self._failures[host] = failures
+        if failures >= self._failure_threshold:
+            if host not in self._opened_at:
+                logger.warning("Circuit opened for {host} after {count} failure(s)", host=host, count=failures)
+            self._opened_at[host] = time.monotonic()
+
+
+class LatencyTracker:
+    """Rolling window of successful request latencies per host."""
+
+    def __init__(self, window: int = 50) -> None:
+        self._window = window
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, host: str, seconds: float) -> None:
+        samples = self._samples.get(host)
+        if samples is None:
+            samples = self._samples[host] = deque(maxlen=self._window)
+        samples.append(seconds)
+
+    def percentile(self, host: str, percentile: float, *, min_samples: int) -> float | None:
+        samples = self._samples.get(host)
+        if not samples or len(samples) < min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, round(percentile / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+class ResilientRequester:
+    """Run a request with jittered retries, a circuit breaker and hedging."""
+
+    def __init__(self, settings: Settings) -> None:
+        self._attempts = settings.http_retries
+        self._backoff_base = settings.http_backoff_base_seconds
+        self._backoff_max = settings.http_backoff_max_seconds
+        self._jitter = settings.http_backoff_jitter
+        self._hedge_enabled = settings.http_hedge_enabled
+        self._hedge_percentile = settings.http_hedge_percentile
+        self._hedge_min_samples = settings.http_hedge_min_samples
+        self._hedge_delay = settings.http_hedge_delay_seconds
+        self._breaker = CircuitBreaker(
+            failure_threshold=settings.circuit_breaker_failure_threshold,
+            reset_seconds=settings.circuit_breaker_reset_seconds,
+        )
+        self._latency = LatencyTracker()
+
+    async def run(self, url: str, send: Callable[[], Awaitable[T]]) -> T:
+        host = httpx.URL(url).host
+        last_error: Exception | None = None
+        for attempt in range(1, self._attempts + 1):
+            if not self._breaker.allow(host):
+                raise CircuitOpenError(f"Circuit open for {host}, skipping {url}")
+            probe = self._breaker.probing(host)
+            try:
+                result = await self._hedged(host, send)
+            except Exception as exc:
+                if not _is_retryable(exc):
+                    if probe:
+                        self._breaker.release(host)
+                    raise
+                last_error = exc
+                self._breaker.record_failure(host)
+                if attempt >= self._attempts:
+                    break
+                delay = self._backoff_delay(attempt)
+                logger.warning(
+                    "Request failed ({url}) attempt {attempt}/{retries}, retrying in {delay:.1f}s: {error}",
+                    url=url,
+                    attempt=attempt,
+                    retries=self._attempts,
+                    delay=delay,
+                    error=exc,
+                )
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:  # cancelled while holding the probe
+                if probe:
+                    self._breaker.release(host)
+                raise
+            self._breaker.record_success(host)
+            return result
+        assert last_error is not None
+        raise last_error
+
+    def _backoff_delay(self, attempt: int) -> float:
+        ceiling = min(self._backoff_base * 2 ** (attempt - 1), self._backoff_max)
+        return ceiling * (1 - self._jitter * random.random())
+
+    async def _hedged(self, host: str, send: Callable[[], Awaitable[T]]) -> T:
+        started = time.perf_counter()
+        hedge_after = self._hedge_threshold(host)
+        if hedge_after is None:
+            result = await send()
+            self._latency.record(host, time.perf_counter() - started)
+            return result
+
+        primary = asyncio.ensure_future(send())
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        if done:
+            result = primary.result()
+            self._latency.record(host, time.perf_counter() - started)
+            return result
+
+        logger.debug("Hedging request to {host} after {delay:.2f}s", host=host, delay=hedge_after)
+        pending = {primary, asyncio.ensure_future(send())}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    self._latency.record(host, time.perf_counter() - started)
+                    return succeeded[0].result()
+            # Both attempts failed; surface the primary's error.
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _hedge_threshold(self, host: str) -> float | None:
+        if not self._hedge_enabled:
+            return None
+        threshold = self._latency.percentile(
+            host,
+            self._hedge_percentile,
+            min_samples=self._hedge_min_samples,
+        )
+        return threshold if threshold is not None else self._hedge_delay
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, httpx.RequestError):  # includes timeouts, network issues
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == httpx.codes.TOO_MANY_REQUESTS or status >= 500
+    return False
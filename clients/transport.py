@@ -0,0 +1,69 @@
+"""Shared HTTP transport used by every API client."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from typing import Any, Mapping
+
+import httpx
+from loguru import logger
+
+from settings import Settings
+
+
+class HttpTransport:
+    """One pooled ``httpx.AsyncClient`` shared by the API clients.
+
+    The pool keeps connections alive between requests so both announcement
+    endpoints of a game reuse the same TLS session, multiplexes over HTTP/2
+    when the optional ``h2`` package is installed, and caps the number of
+    concurrent requests per host.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        http2 = settings.http2_enabled and _http2_available()
+        if settings.http2_enabled and not http2:
+            logger.debug("HTTP/2 requested but the 'h2' package is missing, using HTTP/1.1")
+        self._client = httpx.AsyncClient(
+            timeout=settings.http_timeout_seconds,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry_seconds,
+            ),
+        )
+        self._per_host_limit = settings.http_max_connections_per_host
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> "HttpTransport":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def get(
+        self,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> httpx.Response:
+        host = httpx.URL(url).host
+        async with self._slot(host):
+            return await self._client.get(url, params=params, headers=headers)
+
+    def _slot(self, host: str) -> asyncio.Semaphore:
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self._per_host_limit)
+            self._host_slots[host] = slot
+        return slot
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
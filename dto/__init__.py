@@ -1,6 +1,6 @@
 """Data-transfer objects for Hoyolab API responses."""
 
-from .ann_content import AnnContentRe
-from .ann_list import AnnListRe
+from .ann_content import AnnContentRe, SlimAnnContentRe
+from .ann_list import AnnListRe, SlimAnnListRe
 
-__all__ = ["AnnContentRe", "AnnListRe"]
+__all__ = ["AnnContentRe", "AnnListRe", "SlimAnnContentRe", "SlimAnnListRe"]
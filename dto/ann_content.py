@@ -7,13 +7,18 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 
-class AnnouncementWithContent(BaseModel):
+class SlimAnnouncementWithContent(BaseModel):
+    """Projection of ``AnnouncementWithContent`` holding only the fields plugins read."""
+
     ann_id: int
-    content_type: Optional[int] = None
     title: str
-    subtitle: str
     banner: str
     content: str
+
+
+class AnnouncementWithContent(SlimAnnouncementWithContent):
+    content_type: Optional[int] = None
+    subtitle: str
     lang: str
     img: Optional[str] = None
     href: Optional[str] = None
@@ -21,14 +26,27 @@ class AnnouncementWithContent(BaseModel):
     remind_text: str
 
 
-class AnnContentData(BaseModel):
+class SlimAnnContentData(BaseModel):
+    content_items: list[SlimAnnouncementWithContent] = Field(alias="list")
+    pic_list: list[SlimAnnouncementWithContent]
+
+
+class AnnContentData(SlimAnnContentData):
     content_items: list[AnnouncementWithContent] = Field(alias="list")
     total: int
     pic_list: list[AnnouncementWithContent]
     pic_total: int
 
 
-class AnnContentRe(BaseModel):
+class SlimAnnContentRe(BaseModel):
+    """Announcement content response validated with the slim projection models."""
+
     retcode: int
     message: str
+    data: SlimAnnContentData
+
+
+class AnnContentRe(SlimAnnContentRe):
+    """Full announcement content response, used when strict validation is enabled."""
+
     data: AnnContentData
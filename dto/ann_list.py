@@ -8,19 +8,25 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 
-class AnnouncementRecord(BaseModel):
+class SlimAnnouncementRecord(BaseModel):
+    """Projection of ``AnnouncementRecord`` holding only the fields plugins read."""
+
     ann_id: int
     title: str
     subtitle: str
     banner: str
+    tag_label: str
+    start_time: datetime
+    end_time: datetime
+    img: Optional[str] = None
+
+
+class AnnouncementRecord(SlimAnnouncementRecord):
     content: str
     type_label: str
-    tag_label: str
     tag_icon: str
     login_alert: int
     lang: str
-    start_time: datetime
-    end_time: datetime
     ann_type: int = Field(alias="type")
     remind: int
     alert: int
@@ -30,7 +36,6 @@ class AnnouncementRecord(BaseModel):
     has_content: bool
     pic_type: Optional[int] = None
     content_type: Optional[int] = None
-    img: Optional[str] = None
     href_type: Optional[int] = None
     href: Optional[str] = None
     pic_list: Optional[list] = None
@@ -45,24 +50,41 @@ class AnnouncementRecord(BaseModel):
     remind_consumption_type: int
 
 
-class TypeData(BaseModel):
-    ann_list: list[AnnouncementRecord] = Field(alias="list")
+class SlimTypeData(BaseModel):
+    ann_list: list[SlimAnnouncementRecord] = Field(alias="list")
     type_id: int
     type_label: str
 
 
-class PicType(BaseModel):
+class TypeData(SlimTypeData):
+    ann_list: list[AnnouncementRecord] = Field(alias="list")
+
+
+class SlimPicType(BaseModel):
+    ann_list: list[SlimAnnouncementRecord] = Field(alias="list")
+
+
+class PicType(SlimPicType):
     ann_list: list[AnnouncementRecord] = Field(alias="list")
     pic_type: int
 
 
-class Pic(BaseModel):
+class SlimPic(BaseModel):
+    type_list: list[SlimPicType]
+
+
+class Pic(SlimPic):
     type_list: list[PicType]
     type_id: int
     type_label: str
 
 
-class AnnListData(BaseModel):
+class SlimAnnListData(BaseModel):
+    ann_types: list[SlimTypeData] = Field(alias="list")
+    pic_list: list[SlimPic]
+
+
+class AnnListData(SlimAnnListData):
     ann_types: list[TypeData] = Field(alias="list")
     total: int
     type_list: list
@@ -80,7 +102,15 @@ class AnnListData(BaseModel):
     calendar_type: dict
 
 
-class AnnListRe(BaseModel):
+class SlimAnnListRe(BaseModel):
+    """Announcement list response validated with the slim projection models."""
+
     retcode: int
     message: str
+    data: SlimAnnListData
+
+
+class AnnListRe(SlimAnnListRe):
+    """Full announcement list response, used when strict validation is enabled."""
+
     data: AnnListData
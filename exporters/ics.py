@@ -7,15 +7,15 @@ import zlib
 from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Iterable
 
-import aiofiles
 import pytz
 from icalendar import Calendar, Event
-from loguru import logger
 
 from models.config import GameConfig
-from models.game import Announcement, GameTimeline, GameVersion
+from models.game import GameTimeline, GameVersion
+from utils.executor import WorkerPool
+from utils.files import FileWriter
 
 TIMEZONE = pytz.timezone("Asia/Shanghai")
 
@@ -92,45 +92,74 @@ async def export_ics(
     config: GameConfig,
     base_output: Path,
     extra_outputs: Iterable[Path] = (),
+    pool: WorkerPool | None = None,
+    writer: FileWriter | None = None,
 ) -> None:
     targets = [base_output, *extra_outputs]
     for target in targets:
         _prepare_output_tree(target, config.display_name)
-        _clear_existing_ics(target, config.display_name)
 
-    version_payloads = _build_version_payloads(timeline, config)
+    versions = timeline.version_list
+    if pool is None:
+        pool = WorkerPool(kind="thread", workers=0)
+    if writer is None:
+        writer = FileWriter()
 
-    await asyncio.gather(
+    # Rendering is CPU-bound; do it once per mode and share it across targets.
+    rendered = await asyncio.gather(
         *[
-            _write_calendars(target, config, version_payloads, continuous)
-            for target in targets
+            pool.run(render_calendars, versions, config, continuous)
             for continuous in (False, True)
         ]
     )
 
+    written = await asyncio.gather(
+        *[
+            _write_calendars(target, config, calendars, continuous, writer)
+            for target in targets
+            for continuous, calendars in zip((False, True), rendered)
+        ]
+    )
+    # Calendars that no longer exist (a label with no events left) are removed
+    # only after everything else is in place.
+    keep = {path for paths in written for path in paths}
+    for target in targets:
+        for subdir in (target / config.display_name, target / "continuous" / config.display_name):
+            writer.remove_stale(subdir, "*.ics", keep)
+
+
+def render_calendars(
+    versions: list[GameVersion],
+    config: GameConfig,
+    continuous: bool,
+) -> dict[str, bytes]:
+    """Return the serialised ICS body for every calendar, keyed by label and ``"all"``."""
+
+    calendars = _to_calendars(versions, config, continuous=continuous)
+    return {key: calendar.to_ical() for key, calendar in calendars.items()}
+
 
 async def _write_calendars(
     target: Path,
     config: GameConfig,
-    versions: list[dict],
+    calendars: dict[str, bytes],
     continuous: bool,
-) -> None:
-    calendars = _to_calendars(versions, config, continuous=continuous)
+    writer: FileWriter,
+) -> list[Path]:
+    calendars = dict(calendars)
     all_path = target / ("continuous" if continuous else "") / f"{config.display_name}.ics"
     all_path.parent.mkdir(parents=True, exist_ok=True)
     all_calendar = calendars.pop("all")
-    await _write_calendar_file(all_path, all_calendar)
+    await writer.write(all_path, all_calendar)
+    paths = [all_path]
 
     for key, calendar in calendars.items():
         subdir = target / ("continuous" if continuous else "") / config.display_name
         subdir.mkdir(parents=True, exist_ok=True)
-        await _write_calendar_file(subdir / f"{key}.ics", calendar)
-
-
-async def _write_calendar_file(path: Path, calendar: MyCalendar) -> None:
-    async with aiofiles.open(path, "wb") as handle:
-        await handle.write(calendar.to_ical())
-    logger.debug("Wrote calendar {path}", path=path)
+        path = subdir / f"{key}.ics"
+        await writer.write(path, calendar)
+        paths.append(path)
+    return paths
 
 
 def _prepare_output_tree(target: Path, display_name: str) -> None:
@@ -140,43 +169,8 @@ def _prepare_output_tree(target: Path, display_name: str) -> None:
     (target / "continuous" / display_name).mkdir(parents=True, exist_ok=True)
 
 
-def _clear_existing_ics(target: Path, display_name: str) -> None:
-    paths_to_clean = [
-        target / f"{display_name}.ics",
-        target / "continuous" / f"{display_name}.ics",
-    ]
-    dirs_to_clean = [
-        target / display_name,
-        target / "continuous" / display_name,
-    ]
-    for file_path in paths_to_clean:
-        if file_path.exists():
-            file_path.unlink()
-    for directory in dirs_to_clean:
-        if directory.exists():
-            for ics_file in directory.glob("*.ics"):
-                ics_file.unlink()
-
-
-def _build_version_payloads(timeline: GameTimeline, config: GameConfig) -> list[dict]:
-    payloads: list[dict] = []
-    for version in timeline.version_list:
-        payloads.append(
-            {
-                "name": version.name,
-                "code": version.code,
-                "banner": version.banner,
-                "start": version.start_time,
-                "end": version.end_time,
-                "special_program": version.special_program_time,
-                "announcements": version.announcements,
-            }
-        )
-    return payloads
-
-
 def _to_calendars(
-    versions: list[dict],
+    versions: list[GameVersion],
     config: GameConfig,
     *,
     continuous: bool,
@@ -199,13 +193,13 @@ def _to_calendars(
 def _append_version_events(
     *,
     calendars: dict[str, MyCalendar],
-    version: dict[str, Any],
+    version: GameVersion,
     config: GameConfig,
     continuous: bool,
 ) -> None:
     labels = config.calendar
-    code = version.get("code") or ""
-    name = version.get("name") or ""
+    code = version.code or ""
+    name = version.name or ""
     if code and name:
         version_name = f"{code}版本「{name}」"
     elif code:
@@ -215,17 +209,17 @@ def _append_version_events(
     else:
         version_name = "未知版本"
 
-    if version.get("special_program") is not None:
+    if version.special_program_time is not None:
         calendars[labels.special_program].add_event(
             name=f"{version_name}前瞻特别节目",
-            start=version["special_program"],
+            start=version.special_program_time,
             description=f"{version_name}前瞻特别节目",
             location=f"{config.display_name}-{labels.special_program}",
             continuous=continuous,
         )
 
-    version_period_start = version.get("start")
-    version_period_end = version.get("end")
+    version_period_start = version.start_time
+    version_period_end = version.end_time
     if version_period_start is not None and version_period_end is not None:
         calendars[labels.update].add_event(
             name=f"{version_name}版本",
@@ -239,7 +233,7 @@ def _append_version_events(
     gacha_label = labels.gacha
     event_label = labels.event
 
-    for announcement in version["announcements"]:
+    for announcement in version.announcements:
         if announcement.category == "gacha":
             calendars[gacha_label].add_event(
                 name=announcement.title,
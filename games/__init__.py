@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from functools import lru_cache
 
+from dto import SlimAnnContentRe, SlimAnnListRe
 from models.config import GameConfig
-from .base import GamePlugin
+from .base import GamePlugin, ParseResult, VersionInfo
+from .memo import ParseMemo
 from .genshin import GenshinPlugin
 from .starrail import StarRailPlugin
 from .zenless import ZenlessPlugin
@@ -32,3 +34,29 @@ def available_games() -> list[str]:
 
 def load_game_configs() -> list[GameConfig]:
     return [plugin.config.model_copy(deep=True) for plugin in _plugins().values()]
+
+
+def parse_game_announcements(
+    game_id: str,
+    version: VersionInfo,
+    ann_list: SlimAnnListRe,
+    ann_content: SlimAnnContentRe,
+    existing: dict[int, str],
+    display_name: str,
+    memo: ParseMemo | None,
+) -> tuple[ParseResult, ParseMemo | None]:
+    """Run a plugin's ``parse_announcements`` from plain, picklable arguments.
+
+    Worker processes get copies of their arguments, so the updated memo is
+    handed back alongside the result.
+    """
+
+    result = get_plugin(game_id).parse_announcements(
+        version=version,
+        ann_list=ann_list,
+        ann_content=ann_content,
+        existing=existing,
+        display_name=display_name,
+        memo=memo,
+    )
+    return result, memo
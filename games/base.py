@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
 
-from dto import AnnContentRe, AnnListRe
+from dto import SlimAnnContentRe, SlimAnnListRe
+from dto.ann_list import SlimAnnouncementRecord
 from models.game import Announcement
 from models.config import GameConfig
 
+if TYPE_CHECKING:
+    from .memo import ParseMemo
+
 
 @dataclass(slots=True)
 class VersionInfo:
@@ -25,13 +29,76 @@ class VersionInfo:
     next_version_sp_time: datetime | None = None
 
 
+@dataclass(slots=True)
+class WorkingAnnouncement:
+    """Typed, mutable record a plugin fills in while processing an announcement."""
+
+    ann_id: int
+    title: str
+    subtitle: str
+    banner: str
+    category: str
+    start_time: datetime | None
+    end_time: datetime | None
+
+    @classmethod
+    def from_record(
+        cls,
+        record: SlimAnnouncementRecord,
+        *,
+        title: str,
+        banner: str,
+        category: str,
+    ) -> "WorkingAnnouncement":
+        return cls(
+            ann_id=record.ann_id,
+            title=title,
+            subtitle=record.subtitle,
+            banner=banner,
+            category=category,
+            start_time=record.start_time,
+            end_time=record.end_time,
+        )
+
+    def to_announcement(
+        self,
+        *,
+        game: str,
+        default_start: datetime | None,
+        fingerprint: str = "",
+    ) -> Announcement:
+        return Announcement(
+            id=self.ann_id,
+            title=self.title,
+            description=self.subtitle,
+            game=game,
+            start_time=self.start_time or default_start or datetime.now(),
+            end_time=self.end_time,
+            banner=self.banner,
+            category=self.category,
+            fingerprint=fingerprint,
+        )
+
+
+@dataclass(slots=True)
+class ParseResult:
+    """Announcements a plugin produced, split by what they mean for the stored copy."""
+
+    # Ids the stored version did not have.
+    added: list[Announcement] = field(default_factory=list)
+    # Stored ids whose source fingerprint changed, re-parsed.
+    updated: list[Announcement] = field(default_factory=list)
+    # Stored ids whose source fingerprint matched; not parsed again.
+    unchanged: int = 0
+
+
 class GamePlugin(Protocol):
     """Abstraction for game-specific behaviour."""
 
     game_id: str
     config: GameConfig
 
-    def extract_version(self, ann_list: AnnListRe) -> VersionInfo:
+    def extract_version(self, ann_list: SlimAnnListRe) -> VersionInfo:
         """Return the active version information for the supplied announcement list."""
         ...
 
@@ -39,24 +106,17 @@ class GamePlugin(Protocol):
         self,
         *,
         version: VersionInfo,
-        ann_list: AnnListRe,
-        ann_content: AnnContentRe,
-        existing_ids: set[int],
+        ann_list: SlimAnnListRe,
+        ann_content: SlimAnnContentRe,
+        existing: dict[int, str],
         display_name: str,
-    ) -> list[Announcement]:
-        """Return announcement objects for the current version."""
-        ...
+        memo: ParseMemo | None = None,
+    ) -> ParseResult:
+        """Return announcement objects for the current version.
 
+        ``existing`` maps the stored announcements' ids to their source
+        fingerprints; only new or changed ones are parsed. ``memo`` lets the
+        rest skip content parsing when their inputs are unchanged.
+        """
+        ...
 
-def parse_time(value: str | None) -> datetime | None:
-    """Parse the ISO-like timestamps returned by Hoyolab."""
-
-    if value in (None, ""):
-        return None
-    value = value.replace("T", " ")
-    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-        try:
-            return datetime.strptime(value, fmt)
-        except ValueError:
-            continue
-    return None
@@ -0,0 +1,373 @@
+"""Table-driven announcement extraction shared by every game plugin.
+
+A plugin describes its game as a :class:`GameRules` table: which notice
+carries the version, where candidate announcements live, how titles are
+classified and, per category, how the title, banner and time hints are
+located. :class:`RuleEngine` compiles the table once and then processes a
+whole announcement list in one pass.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, Literal
+
+from dto import SlimAnnContentRe, SlimAnnListRe
+from dto.ann_content import SlimAnnouncementWithContent
+from dto.ann_list import SlimAnnouncementRecord
+from models.config import GameConfig
+from models.version import VersionKey
+from parsers import patterns
+from parsers.classifier import TitleClassifier
+from parsers.content import ContentIndex
+from parsers.document import AnnouncementDocument
+from parsers.text import extract_clean_time, extract_floats, extract_inner_text
+from .base import ParseResult, VersionInfo, WorkingAnnouncement
+from .memo import ParseMemo, ProcessFn, source_fingerprint
+
+# Start hint plus an optional end hint; ``None`` leaves the record's end time alone.
+TimeHints = tuple[str, str | None]
+TextLocator = Callable[
+    [SlimAnnouncementRecord, SlimAnnouncementWithContent, AnnouncementDocument], str
+]
+# Like ``TextLocator``, but given the record's title as cleaned by the classifier.
+TitleLocator = Callable[[str, SlimAnnouncementWithContent, AnnouncementDocument], str]
+
+
+@dataclass(frozen=True, slots=True)
+class Handler:
+    """How to turn one classified announcement into a working record."""
+
+    name: str
+    category: str
+    title: TitleLocator
+    banner: TextLocator
+    time_hints: Callable[[AnnouncementDocument], TimeHints]
+    # The match is passed over when the content mentions any of these.
+    content_excludes: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Source:
+    """One group of candidate records in the announcement list.
+
+    ``content`` names the content lists, in precedence order, that hold the
+    HTML for these records; sources naming the same lists share one index.
+    """
+
+    group: Literal["ann_types", "pic_list"]
+    handlers: tuple[Handler, ...]
+    content: tuple[str, ...] = ("content_items",)
+    type_labels: tuple[str, ...] = ()
+    type_ids: tuple[int, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class VersionNotice:
+    """Where the current version's update notice is and how to read its code."""
+
+    type_label: str
+    rules: TitleClassifier
+    code: Callable[[str], str]
+
+
+@dataclass(frozen=True, slots=True)
+class GameRules:
+    """Everything that differs between games, written as data."""
+
+    version_notice: VersionNotice
+    classifier: TitleClassifier
+    sources: tuple[Source, ...]
+    time_format: str
+    version_hint: Callable[[str], str | None]
+
+
+class RuleEngine:
+    """Compiled form of a :class:`GameRules` table."""
+
+    def __init__(self, game_id: str, rules: GameRules) -> None:
+        self.game_id = game_id
+        self.rules = rules
+        self._processors: dict[Handler, ProcessFn] = {
+            handler: self._compile(handler)
+            for source in rules.sources
+            for handler in source.handlers
+        }
+        self._source_handlers = tuple(
+            {handler.category: handler for handler in source.handlers}
+            for source in rules.sources
+        )
+
+    def extract_version(self, ann_list: SlimAnnListRe) -> VersionInfo:
+        notice_rules = self.rules.version_notice
+        notices = next(
+            (
+                item
+                for item in ann_list.data.ann_types
+                if item.type_label == notice_rules.type_label
+            ),
+            None,
+        )
+        if notices is None:
+            return _unknown_version()
+
+        for ann in notices.ann_list:
+            classified = notice_rules.rules.classify(ann.title)
+            if classified.category is not None:
+                break
+        else:
+            return _unknown_version()
+
+        return VersionInfo(
+            code=notice_rules.code(classified.title),
+            name=extract_inner_text(classified.title) or "未知",
+            banner=ann.banner,
+            start_time=ann.start_time.replace(hour=11, minute=0, second=0),
+            end_time=ann.end_time.replace(hour=6, minute=0, second=0),
+        )
+
+    def parse_announcements(
+        self,
+        *,
+        version: VersionInfo,
+        ann_list: SlimAnnListRe,
+        ann_content: SlimAnnContentRe,
+        existing: dict[int, str],
+        display_name: str,
+        memo: ParseMemo | None = None,
+    ) -> ParseResult:
+        memo = memo if memo is not None else ParseMemo()
+        next_version_begin = guess_next_version_begin(version.end_time)
+        indexes: dict[tuple[str, ...], ContentIndex] = {}
+        seen_ids: set[int] = set()
+        result = ParseResult()
+
+        for source, handlers in zip(self.rules.sources, self._source_handlers):
+            content_index = indexes.get(source.content)
+            if content_index is None:
+                content_index = indexes[source.content] = ContentIndex(
+                    *(getattr(ann_content.data, name) for name in source.content)
+                )
+            for record in _source_records(source, ann_list):
+                if record.ann_id in seen_ids:
+                    continue
+                content = content_index.get(record.ann_id)
+                if content is None:
+                    continue
+                selected = self._select(handlers, record, content)
+                if selected is None:
+                    continue
+                handler, title = selected
+                fingerprint = source_fingerprint(record, content)
+                stored = existing.get(record.ann_id)
+                if stored == fingerprint:
+                    memo.keep(record.ann_id)
+                    result.unchanged += 1
+                else:
+                    item = memo.resolve(
+                        self._processors[handler],
+                        record,
+                        content,
+                        title,
+                        fingerprint,
+                        version.code,
+                        version.start_time,
+                        next_version_begin,
+                    )
+                    announcement = item.to_announcement(
+                        game=display_name,
+                        default_start=version.start_time,
+                        fingerprint=fingerprint,
+                    )
+                    if stored is None:
+                        result.added.append(announcement)
+                    else:
+                        result.updated.append(announcement)
+                seen_ids.add(record.ann_id)
+                content_index.release(record.ann_id)
+        return result
+
+    def _select(
+        self,
+        handlers: dict[str, Handler],
+        record: SlimAnnouncementRecord,
+        content: SlimAnnouncementWithContent,
+    ) -> tuple[Handler, str] | None:
+        for classified in self.rules.classifier.classify_all(record.title, tag=record.tag_label):
+            handler = handlers.get(classified.category)
+            if handler is None:
+                return None
+            if any(phrase in content.content for phrase in handler.content_excludes):
+                continue
+            return handler, classified.title
+        return None
+
+    def _compile(self, handler: Handler) -> ProcessFn:
+        rules = self.rules
+
+        def process(
+            record: SlimAnnouncementRecord,
+            ann_content: SlimAnnouncementWithContent,
+            title: str,
+            version_now: str,
+            version_begin_time: datetime | None,
+            next_version_begin_time: datetime | None,
+        ) -> WorkingAnnouncement:
+            document = AnnouncementDocument(ann_content.content)
+            announcement = WorkingAnnouncement.from_record(
+                record,
+                title=handler.title(title, ann_content, document),
+                banner=handler.banner(record, ann_content, document),
+                category=handler.category,
+            )
+            start_hint, end_hint = handler.time_hints(document)
+            anchor_start = _resolve_version_start_hint(
+                rules.version_hint(start_hint) if start_hint else None,
+                version_now,
+                version_begin_time,
+                next_version_begin_time,
+            )
+            if anchor_start is not None:
+                announcement.start_time = anchor_start
+                if end_hint is not None:
+                    try:
+                        announcement.end_time = _parse_hint_time(end_hint, rules.time_format)
+                    except ValueError:
+                        pass
+                return announcement
+            try:
+                start_time = _parse_hint_time(start_hint, rules.time_format)
+                end_time = (
+                    _parse_hint_time(end_hint, rules.time_format)
+                    if end_hint is not None
+                    else announcement.end_time
+                )
+            except ValueError:
+                return announcement
+            announcement.start_time = start_time
+            announcement.end_time = end_time
+            return announcement
+
+        # The memo fingerprints processors by qualified name.
+        process.__qualname__ = f"RuleEngine.{self.game_id}.{handler.name}"
+        return process
+
+
+class RulePlugin:
+    """Game plugin whose behaviour is entirely described by :attr:`rules`."""
+
+    game_id: str
+    config: GameConfig
+    rules: GameRules
+
+    def __init__(self) -> None:
+        self.engine = RuleEngine(self.game_id, self.rules)
+
+    def extract_version(self, ann_list: SlimAnnListRe) -> VersionInfo:
+        return self.engine.extract_version(ann_list)
+
+    def parse_announcements(
+        self,
+        *,
+        version: VersionInfo,
+        ann_list: SlimAnnListRe,
+        ann_content: SlimAnnContentRe,
+        existing: dict[int, str],
+        display_name: str,
+        memo: ParseMemo | None = None,
+    ) -> ParseResult:
+        return self.engine.parse_announcements(
+            version=version,
+            ann_list=ann_list,
+            ann_content=ann_content,
+            existing=existing,
+            display_name=display_name,
+            memo=memo,
+        )
+
+
+def record_title(
+    title: str,
+    ann_content: SlimAnnouncementWithContent,
+    document: AnnouncementDocument,
+) -> str:
+    return title
+
+
+def record_banner(
+    record: SlimAnnouncementRecord,
+    ann_content: SlimAnnouncementWithContent,
+    document: AnnouncementDocument,
+) -> str:
+    return record.banner
+
+
+def record_image(
+    record: SlimAnnouncementRecord,
+    ann_content: SlimAnnouncementWithContent,
+    document: AnnouncementDocument,
+) -> str:
+    return record.img or ""
+
+
+def content_banner(
+    record: SlimAnnouncementRecord,
+    ann_content: SlimAnnouncementWithContent,
+    document: AnnouncementDocument,
+) -> str:
+    return ann_content.banner
+
+
+def first_float_code(title: str) -> str:
+    floats = extract_floats(title)
+    return str(floats[0]) if floats else "0.0"
+
+
+def version_hint_code(start_hint: str) -> str | None:
+    match = patterns.VERSION_HINT.search(start_hint)
+    return match.group(1) if match else None
+
+
+def guess_next_version_begin(version_end: datetime | None) -> datetime | None:
+    if isinstance(version_end, datetime):
+        return version_end + timedelta(hours=5)
+    return None
+
+
+def _unknown_version() -> VersionInfo:
+    return VersionInfo(code="0.0", name="未知", banner="", start_time=None, end_time=None)
+
+
+def _source_records(
+    source: Source, ann_list: SlimAnnListRe
+) -> Iterator[SlimAnnouncementRecord]:
+    if source.group == "pic_list":
+        for pic_group in ann_list.data.pic_list:
+            for pic_type in pic_group.type_list:
+                yield from pic_type.ann_list
+        return
+    for item in ann_list.data.ann_types:
+        if item.type_label in source.type_labels or item.type_id in source.type_ids:
+            yield from item.ann_list
+
+
+def _parse_hint_time(hint: str, time_format: str) -> datetime:
+    return datetime.strptime(extract_clean_time(hint), time_format).replace(second=0)
+
+
+def _resolve_version_start_hint(
+    hint_code: str | None,
+    version_now: str,
+    version_begin_time: datetime | None,
+    next_version_begin_time: datetime | None,
+) -> datetime | None:
+    if hint_code is None:
+        return None
+    hint = VersionKey.parse(hint_code)
+    current = VersionKey.parse(version_now)
+    if isinstance(version_begin_time, datetime) and hint == current:
+        return version_begin_time
+    if isinstance(next_version_begin_time, datetime) and hint.is_after(current):
+        return next_version_begin_time
+    return None
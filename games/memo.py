@@ -0,0 +1,226 @@
+"""Persistent memo of per-announcement parse results."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable
+
+from dto.ann_content import SlimAnnouncementWithContent
+from dto.ann_list import SlimAnnouncementRecord
+from .base import WorkingAnnouncement
+
+# Bump whenever a plugin's extraction rules change so stale results are dropped.
+MEMO_REVISION = 2
+
+ProcessFn = Callable[
+    [
+        SlimAnnouncementRecord,
+        SlimAnnouncementWithContent,
+        str,
+        str,
+        datetime | None,
+        datetime | None,
+    ],
+    WorkingAnnouncement,
+]
+
+
+@dataclass(slots=True)
+class MemoEntry:
+    """Fields a plugin extracted from one announcement's record and content."""
+
+    fingerprint: str
+    version: str
+    title: str
+    banner: str
+    category: str
+    start_time: datetime | None
+    end_time: datetime | None
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "version": self.version,
+            "title": self.title,
+            "banner": self.banner,
+            "category": self.category,
+            "start_time": _format_time(self.start_time),
+            "end_time": _format_time(self.end_time),
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "MemoEntry":
+        return cls(
+            fingerprint=payload["fingerprint"],
+            version=payload["version"],
+            title=payload["title"],
+            banner=payload["banner"],
+            category=payload["category"],
+            start_time=_parse_time(payload["start_time"]),
+            end_time=_parse_time(payload["end_time"]),
+        )
+
+
+class ParseMemo:
+    """Reuse earlier parse results for announcements whose inputs are unchanged.
+
+    Entries are keyed by ``ann_id`` and only reused when the source
+    fingerprint (see :func:`source_fingerprint`), the processor and the
+    version anchors match and the active version code is the same. Entries
+    for announcements that were neither resolved nor kept during a run are
+    evicted by :meth:`retain_seen`.
+
+    Announcements whose stored fingerprint matches never reach the memo. It
+    serves the ones the feed still lists but ``data.json`` no longer holds,
+    chiefly ended events that the prune drops on every run.
+    """
+
+    def __init__(self, entries: dict[int, MemoEntry] | None = None) -> None:
+        self._entries: dict[int, MemoEntry] = entries or {}
+        self._seen: set[int] = set()
+        self.hits = 0
+        self.misses = 0
+        self.changed = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def resolve(
+        self,
+        process: ProcessFn,
+        record: SlimAnnouncementRecord,
+        ann_content: SlimAnnouncementWithContent,
+        title: str,
+        source: str,
+        version_now: str,
+        version_begin_time: datetime | None,
+        next_version_begin_time: datetime | None,
+    ) -> WorkingAnnouncement:
+        """Return the memoised result for ``record`` or run ``process`` and store it.
+
+        ``title`` is the record's cleaned title, handed on to ``process``; ``source``
+        is the :func:`source_fingerprint` of ``record`` and ``ann_content``.
+        """
+
+        fingerprint = _fingerprint(process, source, version_begin_time, next_version_begin_time)
+        self._seen.add(record.ann_id)
+        entry = self._entries.get(record.ann_id)
+        if entry is not None and entry.fingerprint == fingerprint and entry.version == version_now:
+            self.hits += 1
+            return WorkingAnnouncement(
+                ann_id=record.ann_id,
+                title=entry.title,
+                subtitle=record.subtitle,
+                banner=entry.banner,
+                category=entry.category,
+                start_time=entry.start_time,
+                end_time=entry.end_time,
+            )
+
+        self.misses += 1
+        announcement = process(
+            record,
+            ann_content,
+            title,
+            version_now,
+            version_begin_time,
+            next_version_begin_time,
+        )
+        self._entries[record.ann_id] = MemoEntry(
+            fingerprint=fingerprint,
+            version=version_now,
+            title=announcement.title,
+            banner=announcement.banner,
+            category=announcement.category,
+            start_time=announcement.start_time,
+            end_time=announcement.end_time,
+        )
+        self.changed = True
+        return announcement
+
+    def keep(self, ann_id: int) -> None:
+        """Keep the entry for ``ann_id`` through :meth:`retain_seen` without resolving it."""
+
+        self._seen.add(ann_id)
+
+    def retain_seen(self) -> int:
+        """Drop entries for announcements not resolved since loading; return the count."""
+
+        stale = [ann_id for ann_id in self._entries if ann_id not in self._seen]
+        for ann_id in stale:
+            del self._entries[ann_id]
+        if stale:
+            self.changed = True
+        return len(stale)
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "revision": MEMO_REVISION,
+            "entries": {
+                str(ann_id): self._entries[ann_id].to_payload()
+                for ann_id in sorted(self._entries)
+            },
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "ParseMemo":
+        if payload.get("revision") != MEMO_REVISION:
+            return cls()
+        return cls(
+            {
+                int(ann_id): MemoEntry.from_payload(entry)
+                for ann_id, entry in payload.get("entries", {}).items()
+            }
+        )
+
+
+def source_fingerprint(
+    record: SlimAnnouncementRecord,
+    ann_content: SlimAnnouncementWithContent,
+) -> str:
+    """Digest of the publisher's fields for one announcement: list record plus content."""
+
+    return _digest(
+        record.title,
+        record.subtitle,
+        record.banner,
+        record.tag_label,
+        record.img or "",
+        _format_time(record.start_time),
+        _format_time(record.end_time),
+        ann_content.title,
+        ann_content.banner,
+        ann_content.content,
+    )
+
+
+def _fingerprint(
+    process: ProcessFn,
+    source: str,
+    version_begin_time: datetime | None,
+    next_version_begin_time: datetime | None,
+) -> str:
+    return _digest(
+        f"{process.__module__}.{process.__qualname__}",
+        source,
+        _format_time(version_begin_time),
+        _format_time(next_version_begin_time),
+    )
+
+
+def _digest(*parts: str | None) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update((part or "").encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def _format_time(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value is not None else None
@@ -4,18 +4,42 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+from datetime import datetime
 from pathlib import Path
 from typing import Sequence
 
 from services.pipeline import run_pipeline
+from services.query import run_query
 from settings import Settings, get_settings
 
 
+def _local_datetime(value: str) -> datetime:
+    """Parse an ISO datetime; one with a UTC offset becomes naive local time."""
+
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid ISO datetime: {value!r}") from exc
+    if moment.tzinfo is not None:
+        moment = moment.astimezone().replace(tzinfo=None)
+    return moment
+
+
+def _non_negative_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from exc
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more: {value!r}")
+    return number
+
+
 def create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="hoyo_calendar maintenance CLI")
     parser.add_argument(
         "command",
-        choices=["update"],
+        choices=["update", "query"],
         nargs="?",
         default="update",
         help="Action to perform (default: update)",
@@ -42,6 +66,56 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Force enable mock responses regardless of the environment",
     )
+    parser.add_argument(
+        "--no-http-cache",
+        action="store_true",
+        help="Disable the on-disk conditional-GET response cache",
+    )
+    parser.add_argument(
+        "--strict-payloads",
+        action="store_true",
+        help="Validate API responses against the full DTOs instead of the slim projections",
+    )
+    parser.add_argument(
+        "--no-parse-memo",
+        action="store_true",
+        help="Re-parse every announcement instead of reusing memoised results",
+    )
+    parser.add_argument(
+        "--timeline-snapshot",
+        action="store_true",
+        help="Keep a binary snapshot beside each data.json to speed up repeated local loads",
+    )
+    parser.add_argument(
+        "--workers",
+        type=_non_negative_int,
+        default=None,
+        help="Worker count for parsing and ICS rendering (0 runs them on the event loop)",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=["process", "thread"],
+        default=None,
+        help="Worker pool type (default: thread)",
+    )
+    parser.add_argument(
+        "--at",
+        type=_local_datetime,
+        default=None,
+        help="query: moment to report on, as an ISO datetime (default: now)",
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=7,
+        help="query: how many days ahead to list upcoming events (default: 7)",
+    )
+    parser.add_argument(
+        "--game",
+        action="append",
+        default=None,
+        help="query: limit output to a game id or display name (can be repeated)",
+    )
     return parser
 
 
@@ -56,6 +130,18 @@ def build_settings_from_args(args: argparse.Namespace) -> Settings:
         updates["extra_ics_dirs"] = [path.resolve() for path in args.extra_ics_dir]
     if args.debug_mocks:
         updates["enable_debug_mocks"] = True
+    if args.no_http_cache:
+        updates["enable_http_cache"] = False
+    if args.strict_payloads:
+        updates["strict_payload_validation"] = True
+    if args.no_parse_memo:
+        updates["enable_parse_memo"] = False
+    if args.timeline_snapshot:
+        updates["enable_timeline_snapshot"] = True
+    if args.workers is not None:
+        updates["executor_workers"] = args.workers
+    if args.executor:
+        updates["executor_kind"] = args.executor
     if updates:
         settings = settings.model_copy(update=updates)
     return settings
@@ -68,6 +154,8 @@ def main(argv: Sequence[str] | None = None) -> None:
 
     if args.command == "update":
         asyncio.run(run_pipeline(settings))
+    elif args.command == "query":
+        asyncio.run(run_query(settings, at=args.at, days=args.days, games=args.game))
 
 
 if __name__ == "__main__":
@@ -2,49 +2,214 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Iterable, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from .intervals import AnnouncementIntervals
+from .version import VersionKey
 
 
-class Announcement(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+@dataclass(slots=True)
+class Announcement:
+    """A calendar event. Persisted through ``services.storage``; no validation here."""
 
     id: int
     title: str
     description: str
     game: str
+    category: str
     start_time: datetime
     end_time: datetime | None = None
     banner: str = ""
-    category: str = Field(alias="ann_type")
+    # Digest of the publisher's fields this record was parsed from; empty when unknown.
+    fingerprint: str = ""
 
 
-class GameVersion(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+def _private(**kwargs):
+    """A cache or bookkeeping field: not an init argument, not compared or shown."""
 
+    return field(init=False, repr=False, compare=False, **kwargs)
+
+
+@dataclass(slots=True)
+class ChangeSet:
+    """Announcement ids added, modified or removed since tracking started."""
+
+    added: set[int] = field(default_factory=set)
+    modified: set[int] = field(default_factory=set)
+    removed: set[int] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+    def record_added(self, ann_id: int) -> None:
+        if ann_id in self.removed:
+            self.removed.discard(ann_id)
+            self.modified.add(ann_id)
+        else:
+            self.added.add(ann_id)
+
+    def record_modified(self, ann_id: int) -> None:
+        if ann_id not in self.added:
+            self.modified.add(ann_id)
+
+    def record_removed(self, ann_id: int) -> None:
+        if ann_id in self.added:
+            self.added.discard(ann_id)
+        else:
+            self.modified.discard(ann_id)
+            self.removed.add(ann_id)
+
+
+@dataclass(slots=True)
+class TimelineChanges:
+    """What a run changed in a :class:`GameTimeline`."""
+
+    added_versions: list[GameVersion] = field(default_factory=list)
+    modified_versions: list[GameVersion] = field(default_factory=list)
+    removed_versions: list[GameVersion] = field(default_factory=list)
+    # Announcement changes merged across the added and modified versions.
+    announcements: ChangeSet = field(default_factory=ChangeSet)
+
+    def __bool__(self) -> bool:
+        return bool(self.added_versions or self.modified_versions or self.removed_versions)
+
+
+@dataclass(slots=True)
+class GameVersion:
     name: str
     code: str
     banner: str = ""
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
-    special_program_time: Optional[datetime] = Field(default=None, alias="sp_time")
-    announcements: list[Announcement] = Field(default_factory=list, alias="ann_list")
+    special_program_time: Optional[datetime] = None
+    announcements: list[Announcement] = field(default_factory=list)
+
+    # ``ann_id`` index over ``announcements``; rebuilt whenever the list is
+    # replaced or changes length behind the model's back.
+    _by_id: dict[int, Announcement] | None = _private(default=None)
+    _indexed: tuple[list[Announcement], int] | None = _private(default=None)
+    # Changes made through the methods below; direct field writes are not seen.
+    _changes: ChangeSet = _private(default_factory=ChangeSet)
+    _original: dict[str, object] = _private(default_factory=dict)
+    _reordered: bool = _private(default=False)
+
+    @property
+    def key(self) -> VersionKey:
+        return VersionKey.parse(self.code)
+
+    def _announcement_index(self) -> dict[int, Announcement]:
+        if self._by_id is None or not _is_current(self._indexed, self.announcements):
+            by_id: dict[int, Announcement] = {}
+            for announcement in self.announcements:
+                by_id.setdefault(announcement.id, announcement)
+            self._by_id = by_id
+            self._indexed = (self.announcements, len(self.announcements))
+        return self._by_id
+
+    def announcement_fingerprints(self) -> dict[int, str]:
+        return {
+            ann_id: announcement.fingerprint
+            for ann_id, announcement in self._announcement_index().items()
+        }
 
     def upsert_announcement(self, announcement: Announcement) -> None:
-        if any(item.id == announcement.id for item in self.announcements):
+        index = self._announcement_index()
+        if announcement.id in index:
             return
         self.announcements.append(announcement)
+        index[announcement.id] = announcement
+        self._indexed = (self.announcements, len(self.announcements))
+        self._changes.record_added(announcement.id)
+
+    def update_announcements(self, announcements: Iterable[Announcement]) -> None:
+        """Swap stored announcements for new copies with the same id, in place.
+
+        Announcements this version does not hold are ignored.
+        """
+
+        index = self._announcement_index()
+        updates = {
+            announcement.id: announcement
+            for announcement in announcements
+            if announcement.id in index
+        }
+        if updates:
+            self.replace_announcements(
+                [updates.get(announcement.id, announcement) for announcement in self.announcements]
+            )
 
     def replace_announcements(self, announcements: Iterable[Announcement]) -> None:
-        self.announcements = list(announcements)
+        previous = self._announcement_index()
+        replacement = list(announcements)
+        if replacement != self.announcements:
+            current: dict[int, Announcement] = {}
+            for announcement in replacement:
+                current.setdefault(announcement.id, announcement)
+            for ann_id, announcement in current.items():
+                if ann_id not in previous:
+                    self._changes.record_added(ann_id)
+                elif previous[ann_id] is not announcement and previous[ann_id] != announcement:
+                    self._changes.record_modified(ann_id)
+            for ann_id in previous.keys() - current.keys():
+                self._changes.record_removed(ann_id)
+            # Announcements kept on both sides but reordered or duplicated.
+            kept_before = [item.id for item in self.announcements if item.id in current]
+            kept_after = [item.id for item in replacement if item.id in previous]
+            if kept_before != kept_after:
+                self._reordered = True
+        self.announcements = replacement
+        self._by_id = None
+
+    @property
+    def is_dirty(self) -> bool:
+        return (
+            self._reordered
+            or bool(self._changes)
+            or any(getattr(self, name) != value for name, value in self._original.items())
+        )
+
+    @property
+    def changes(self) -> ChangeSet:
+        return self._changes
 
+    def _update(self, **values) -> None:
+        for name, value in values.items():
+            current = getattr(self, name)
+            if current != value:
+                self._original.setdefault(name, current)
+                setattr(self, name, value)
 
-class GameTimeline(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
 
-    version_list: list[GameVersion] = Field(default_factory=list)
+@dataclass(slots=True)
+class GameTimeline:
+    version_list: list[GameVersion] = field(default_factory=list)
+
+    # Name and code indexes over ``version_list``, first match wins; rebuilt
+    # whenever the list is replaced, changes length or a version is renamed.
+    _by_name: dict[str, GameVersion] | None = _private(default=None)
+    _by_key: dict[VersionKey, GameVersion] = _private(default_factory=dict)
+    _indexed: tuple[list[GameVersion], int] | None = _private(default=None)
+    # Versions added or removed through the methods below.
+    _added: list[GameVersion] = _private(default_factory=list)
+    _removed: list[GameVersion] = _private(default_factory=list)
+    # Interval index plus the (list, length) pairs it was built from.
+    _intervals: tuple[list[tuple[list, int]], AnnouncementIntervals] | None = _private(
+        default=None
+    )
+
+    def _version_index(self) -> tuple[dict[str, GameVersion], dict[VersionKey, GameVersion]]:
+        if self._by_name is None or not _is_current(self._indexed, self.version_list):
+            by_name: dict[str, GameVersion] = {}
+            by_key: dict[VersionKey, GameVersion] = {}
+            for version in self.version_list:
+                by_name.setdefault(version.name, version)
+                by_key.setdefault(version.key, version)
+            self._by_name = by_name
+            self._by_key = by_key
+            self._indexed = (self.version_list, len(self.version_list))
+        return self._by_name, self._by_key
 
     def find_version(
         self,
@@ -52,14 +217,11 @@ class GameTimeline(BaseModel):
         code: str | None = None,
         name: str | None = None,
     ) -> GameVersion | None:
-        if name:
-            for version in self.version_list:
-                if version.name == name:
-                    return version
+        by_name, by_key = self._version_index()
+        if name and name in by_name:
+            return by_name[name]
         if code:
-            for version in self.version_list:
-                if version.code == code:
-                    return version
+            return by_key.get(VersionKey.parse(code))
         return None
 
     def upsert_version(
@@ -82,31 +244,141 @@ class GameTimeline(BaseModel):
                 end_time=end_time,
                 special_program_time=special_program_time,
             )
+            by_name, by_key = self._version_index()
             self.version_list.append(version)
+            by_name.setdefault(version.name, version)
+            by_key.setdefault(version.key, version)
+            self._indexed = (self.version_list, len(self.version_list))
+            self._added.append(version)
             return version
+        if code and code != version.code or name and name != version.name:
+            self._by_name = None
+        updates: dict[str, object] = {"special_program_time": special_program_time}
         if code:
-            version.code = code
+            updates["code"] = code
         if name:
-            version.name = name
+            updates["name"] = name
         if banner:
-            version.banner = banner
+            updates["banner"] = banner
         if start_time:
-            version.start_time = start_time
+            updates["start_time"] = start_time
         if end_time:
-            version.end_time = end_time
-
-        version.special_program_time = special_program_time
+            updates["end_time"] = end_time
+        version._update(**updates)
         return version
 
+    def replace_versions(self, versions: Iterable[GameVersion]) -> None:
+        """Swap in a new version list, recording the versions that left or joined."""
+
+        replacement = list(versions)
+        previous = {id(version) for version in self.version_list}
+        current = {id(version) for version in replacement}
+        for version in self.version_list:
+            if id(version) not in current and not _discard(self._added, version):
+                self._removed.append(version)
+        for version in replacement:
+            if id(version) not in previous and not _discard(self._removed, version):
+                self._added.append(version)
+        self.version_list = replacement
+
+    def intervals(self) -> AnnouncementIntervals:
+        """Return the interval index, rebuilding it if any list was replaced or resized."""
+
+        index = self._current_intervals()
+        if index is None:
+            index = AnnouncementIntervals(
+                (version, announcement)
+                for version in self.version_list
+                for announcement in version.announcements
+            )
+            lists = [self.version_list, *(version.announcements for version in self.version_list)]
+            self._intervals = ([(items, len(items)) for items in lists], index)
+        return index
+
+    def _current_intervals(self) -> AnnouncementIntervals | None:
+        if self._intervals is None:
+            return None
+        lists = [self.version_list, *(version.announcements for version in self.version_list)]
+        indexed, index = self._intervals
+        if len(indexed) != len(lists) or not all(map(_is_current, indexed, lists)):
+            return None
+        return index
+
+    def ended_before(self, moment: datetime) -> list[tuple[GameVersion, Announcement]]:
+        """Announcements whose end time is strictly before ``moment``.
+
+        Answered from the interval index when it is still current; otherwise a
+        single scan is cheaper than sorting a fresh index for one question.
+        """
+
+        index = self._current_intervals()
+        if index is not None:
+            return index.ended_before(moment)
+        return [
+            (version, announcement)
+            for version in self.version_list
+            for announcement in version.announcements
+            if announcement.end_time is not None and announcement.end_time < moment
+        ]
+
+    def changes(self) -> TimelineChanges:
+        """Return what changed since the timeline was loaded."""
+
+        result = TimelineChanges(removed_versions=list(self._removed))
+        added = {id(version) for version in self._added}
+        for version in self.version_list:
+            if id(version) in added:
+                result.added_versions.append(version)
+            elif version.is_dirty:
+                result.modified_versions.append(version)
+            else:
+                continue
+            result.announcements.added |= version.changes.added
+            result.announcements.modified |= version.changes.modified
+            result.announcements.removed |= version.changes.removed
+        return result
+
+    def announcement_fingerprints(self) -> dict[int, str]:
+        """Fingerprints of the announcements stored in any version, first copy wins."""
+
+        fingerprints: dict[int, str] = {}
+        for version in self.version_list:
+            for ann_id, fingerprint in version.announcement_fingerprints().items():
+                fingerprints.setdefault(ann_id, fingerprint)
+        return fingerprints
+
+    def update_announcements(self, announcements: Iterable[Announcement]) -> None:
+        """Swap stored announcements for new copies in whichever version holds them."""
+
+        updates = list(announcements)
+        if updates:
+            for version in self.version_list:
+                version.update_announcements(updates)
+
     def inject_announcements(
         self,
         code: str,
         announcements: Iterable[Announcement],
         replace: bool = False,
     ) -> None:
-        version = self.upsert_version(code=code)
+        # An existing version keeps its fields, including the special program time.
+        version = self.find_version(code=code) or self.upsert_version(code=code)
         if replace:
             version.replace_announcements(announcements)
             return
         for announcement in announcements:
             version.upsert_announcement(announcement)
+
+
+def _is_current(indexed: tuple[list, int] | None, items: list) -> bool:
+    return indexed is not None and indexed[0] is items and indexed[1] == len(items)
+
+
+def _discard(items: list, target: object) -> bool:
+    """Remove ``target`` from ``items`` by identity; return whether it was there."""
+
+    for position, item in enumerate(items):
+        if item is target:
+            del items[position]
+            return True
+    return False
@@ -0,0 +1,86 @@
+"""Sorted interval index over announcement start and end times."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from .game import Announcement, GameVersion
+
+Entry = tuple["GameVersion", "Announcement"]
+
+
+class AnnouncementIntervals:
+    """Announcements of a timeline sorted by start time and by end time.
+
+    Two parallel sorted arrays answer window queries with a binary search plus
+    a slice; announcements without an end time are kept apart as open-ended.
+    The index is a snapshot: build a new one after the timeline changes
+    (:meth:`GameTimeline.intervals` does that on demand).
+    """
+
+    __slots__ = ("_entries", "_open_ended", "_start_axis", "_end_axis")
+
+    def __init__(self, entries: Iterable[Entry]) -> None:
+        self._entries = list(entries)
+        self._open_ended = [entry for entry in self._entries if entry[1].end_time is None]
+        # Each axis is sorted on first use, so pruning never pays for the start order.
+        self._start_axis: tuple[list[datetime], list[Entry], dict[int, int]] | None = None
+        self._end_axis: tuple[list[datetime], list[Entry]] | None = None
+
+    def _by_start(self) -> tuple[list[datetime], list[Entry], dict[int, int]]:
+        if self._start_axis is None:
+            by_start = sorted(self._entries, key=lambda entry: entry[1].start_time)
+            rank = {id(entry): position for position, entry in enumerate(by_start)}
+            self._start_axis = ([entry[1].start_time for entry in by_start], by_start, rank)
+        return self._start_axis
+
+    def _by_end(self) -> tuple[list[datetime], list[Entry]]:
+        if self._end_axis is None:
+            by_end = sorted(
+                (entry for entry in self._entries if entry[1].end_time is not None),
+                key=lambda entry: entry[1].end_time,
+            )
+            self._end_axis = ([entry[1].end_time for entry in by_end], by_end)
+        return self._end_axis
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ended_before(self, moment: datetime) -> list[Entry]:
+        """Announcements whose end time is strictly before ``moment``."""
+
+        ends, by_end = self._by_end()
+        return by_end[: bisect_left(ends, moment)]
+
+    def starting_between(self, begin: datetime, end: datetime) -> list[Entry]:
+        """Announcements starting in ``[begin, end)``, ordered by start time."""
+
+        starts, by_start, _ = self._by_start()
+        return by_start[bisect_left(starts, begin) : bisect_left(starts, end)]
+
+    def active_at(self, moment: datetime) -> list[Entry]:
+        """Announcements with ``start <= moment <= end``, ordered by start time.
+
+        Only the smaller of "already started" and "not yet ended" is scanned.
+        """
+
+        starts, by_start, rank = self._by_start()
+        ends, by_end = self._by_end()
+        started = bisect_right(starts, moment)
+        ended = bisect_left(ends, moment)
+        not_ended = len(by_end) - ended + len(self._open_ended)
+        if started <= not_ended:
+            return [
+                entry
+                for entry in by_start[:started]
+                if entry[1].end_time is None or entry[1].end_time >= moment
+            ]
+        candidates = [
+            entry for entry in (*by_end[ended:], *self._open_ended)
+            if entry[1].start_time <= moment
+        ]
+        candidates.sort(key=lambda entry: rank[id(entry)])
+        return candidates
@@ -0,0 +1,99 @@
+"""Comparable keys for game version codes."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from parsers import patterns
+
+_MOON_PREFIX = "月之"
+# 「月之N」codes rank as 100 + N, after every numbered release.
+_MOON_BASE = 100
+
+_NUMERALS = {
+    "零": 0,
+    "〇": 0,
+    "一": 1,
+    "二": 2,
+    "三": 3,
+    "四": 4,
+    "五": 5,
+    "六": 6,
+    "七": 7,
+    "八": 8,
+    "九": 9,
+}
+_NUMERAL_UNITS = {"十": 10, "百": 100, "千": 1000}
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class VersionKey:
+    """A version code parsed once into a totally ordered, hashable key.
+
+    Codes with a number (``"5.3"``, ``"月之八"``) compare by that number, so
+    ``"5.0"`` and ``"5"`` are the same version; any other code compares by its
+    stripped text and sorts after every numbered one. Use :meth:`parse`, which
+    interns keys so each distinct code is parsed only once.
+    """
+
+    sort_key: tuple[int, float, str] = field(repr=False)
+    code: str = field(compare=False)
+    number: float | None = field(compare=False)
+
+    @classmethod
+    def parse(cls, code: str | None) -> "VersionKey":
+        return _parse(code or "")
+
+    @property
+    def is_numbered(self) -> bool:
+        return self.number is not None
+
+    def is_after(self, other: "VersionKey") -> bool:
+        """Whether both codes are numbered and this one is the later release."""
+
+        return self.is_numbered and other.is_numbered and self > other
+
+
+@lru_cache(maxsize=1024)
+def _parse(code: str) -> VersionKey:
+    number = _parse_number(code)
+    if number is None:
+        return VersionKey((1, 0.0, code.strip()), code, None)
+    return VersionKey((0, number, ""), code, number)
+
+
+def _parse_number(code: str) -> float | None:
+    try:
+        number = float(code)
+    except ValueError:
+        match = patterns.VERSION_NUMBER.search(code)
+        if match:
+            return float(match.group(1))
+    else:
+        return number if math.isfinite(number) else None
+    normalized = code.strip()
+    if normalized.startswith(_MOON_PREFIX):
+        numeral = _parse_chinese_numeral(normalized.replace(_MOON_PREFIX, ""))
+        if numeral is not None:
+            return _MOON_BASE + numeral
+    return None
+
+
+def _parse_chinese_numeral(text: str) -> int | None:
+    if not text:
+        return None
+    total = 0
+    current = 0
+    for char in text:
+        if char in _NUMERAL_UNITS:
+            multiplier = current if current > 0 else 1
+            total += multiplier * _NUMERAL_UNITS[char]
+            current = 0
+        else:
+            value = _NUMERALS.get(char)
+            if value is None:
+                return None
+            current = current * 10 + value
+    return total + current
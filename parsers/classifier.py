@@ -0,0 +1,168 @@
+"""Keyword rule classifier for announcement titles.
+
+Rules are checked with plain substring tests. Only a rule set with many
+keywords compiles them into one Aho-Corasick automaton, so a title is scanned
+once however many keywords the rules mention.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Sequence
+
+from .text import remove_html_tags
+
+# Below this many distinct keywords, ``in`` checks beat one automaton scan.
+_AUTOMATON_MIN_KEYWORDS = 64
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton reporting which keywords occur in a text."""
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords: tuple[str, ...] = tuple(dict.fromkeys(k for k in keywords if k))
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[set[int]] = [set()]
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                following = goto[state].get(char)
+                if following is None:
+                    following = len(goto)
+                    goto[state][char] = following
+                    goto.append({})
+                    outputs.append(set())
+                state = following
+            outputs[state].add(index)
+
+        # Breadth-first pass resolving failure links into a full transition
+        # table, so scanning needs exactly one dict lookup per character.
+        failure = [0] * len(goto)
+        delta: list[dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            fallback = failure[state]
+            outputs[state] |= outputs[fallback]
+            delta[state] = {**delta[fallback], **goto[state]}
+            for char, following in goto[state].items():
+                failure[following] = delta[fallback].get(char, 0)
+                queue.append(following)
+        self._delta = delta
+        self._outputs = [frozenset(found) for found in outputs]
+
+    def find_indices(self, text: str) -> set[int]:
+        """Return the positions in :attr:`keywords` of every keyword found in ``text``."""
+
+        delta = self._delta
+        outputs = self._outputs
+        state = 0
+        found: set[int] = set()
+        for char in text:
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                found |= outputs[state]
+        return found
+
+    def index_of(self, keywords: Iterable[str]) -> frozenset[int]:
+        positions = {keyword: index for index, keyword in enumerate(self.keywords)}
+        return frozenset(positions[keyword] for keyword in keywords)
+
+
+@dataclass(frozen=True, slots=True)
+class TitleRule:
+    """One classification rule; every given condition must hold."""
+
+    name: str
+    category: str
+    all_of: tuple[str, ...] = ()
+    any_of: tuple[str, ...] = ()
+    none_of: tuple[str, ...] = ()
+    tag: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TitleClassification:
+    """Cleaned title with the first matching rule, if any."""
+
+    title: str
+    category: str | None
+    rule: str | None
+
+
+# A rule with its keyword conditions as positions in the automaton's keywords.
+_CompiledRule = tuple[TitleRule, frozenset[int], frozenset[int], frozenset[int]]
+
+
+class TitleClassifier:
+    """Classify titles against an ordered rule list; the first match wins."""
+
+    def __init__(self, rules: Sequence[TitleRule]) -> None:
+        self.rules = tuple(rules)
+        keywords = {
+            keyword
+            for rule in self.rules
+            for keyword in (*rule.all_of, *rule.any_of, *rule.none_of)
+            if keyword
+        }
+        self._automaton: KeywordAutomaton | None = None
+        self._compiled: tuple[_CompiledRule, ...] = ()
+        if len(keywords) >= _AUTOMATON_MIN_KEYWORDS:
+            self._automaton = KeywordAutomaton(keywords)
+            # Rules compiled to keyword-index sets so matching is set arithmetic.
+            self._compiled = tuple(
+                (
+                    rule,
+                    self._automaton.index_of(rule.all_of),
+                    self._automaton.index_of(rule.any_of),
+                    self._automaton.index_of(rule.none_of),
+                )
+                for rule in self.rules
+            )
+
+    def classify(self, raw_title: str, *, tag: str | None = None) -> TitleClassification:
+        """Strip markup from ``raw_title`` and return its first matching rule."""
+
+        title = remove_html_tags(raw_title)
+        rule = next(self._matching(title, tag), None)
+        return TitleClassification(
+            title=title,
+            category=rule.category if rule else None,
+            rule=rule.name if rule else None,
+        )
+
+    def classify_all(self, raw_title: str, *, tag: str | None = None) -> Iterator[TitleClassification]:
+        """Yield every matching rule for ``raw_title`` in priority order."""
+
+        title = remove_html_tags(raw_title)
+        for rule in self._matching(title, tag):
+            yield TitleClassification(title=title, category=rule.category, rule=rule.name)
+
+    def _matching(self, title: str, tag: str | None) -> Iterator[TitleRule]:
+        if self._automaton is None:
+            for rule in self.rules:
+                if (rule.tag is None or rule.tag == tag) and _holds(rule, title):
+                    yield rule
+            return
+        found = self._automaton.find_indices(title)
+        for rule, all_of, any_of, none_of in self._compiled:
+            if rule.tag is not None and rule.tag != tag:
+                continue
+            if all_of <= found and (not any_of or any_of & found) and not none_of & found:
+                yield rule
+
+
+def _holds(rule: TitleRule, title: str) -> bool:
+    for keyword in rule.all_of:
+        if keyword not in title:
+            return False
+    for keyword in rule.none_of:
+        if keyword in title:
+            return False
+    if not rule.any_of:
+        return True
+    for keyword in rule.any_of:
+        if keyword in title:
+            return True
+    return False
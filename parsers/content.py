@@ -0,0 +1,39 @@
+"""Lazy ``ann_id`` index over announcement content items."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Iterator
+
+from dto.ann_content import SlimAnnouncementWithContent
+
+
+class ContentIndex:
+    """Look up content items by ``ann_id`` without indexing them up front.
+
+    Sources are scanned only as far as needed to answer a lookup; earlier
+    sources take precedence for duplicate ids. Once an announcement has been
+    processed, :meth:`release` drops the index's reference to it; the item
+    itself is left untouched for anyone else holding the payload.
+    """
+
+    def __init__(self, *sources: Iterable[SlimAnnouncementWithContent]) -> None:
+        self._entries: dict[int, SlimAnnouncementWithContent] = {}
+        self._pending: deque[Iterator[SlimAnnouncementWithContent]] = deque(
+            iter(source) for source in sources
+        )
+
+    def get(self, ann_id: int) -> SlimAnnouncementWithContent | None:
+        entry = self._entries.get(ann_id)
+        if entry is not None:
+            return entry
+        while self._pending:
+            for item in self._pending[0]:
+                self._entries.setdefault(item.ann_id, item)
+                if item.ann_id == ann_id:
+                    return self._entries[ann_id]
+            self._pending.popleft()
+        return None
+
+    def release(self, ann_id: int) -> None:
+        self._entries.pop(ann_id, None)
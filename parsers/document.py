@@ -0,0 +1,78 @@
+"""Per-announcement HTML document shared by every extractor."""
+
+from __future__ import annotations
+
+import html as _html
+
+from bs4 import BeautifulSoup
+
+from . import patterns
+
+# Characters html.parser's tree builder treats as collapsible whitespace.
+_ASCII_SPACES = " \n\t\f\r"
+
+
+class AnnouncementDocument:
+    """One announcement's ``content`` HTML, parsed at most once.
+
+    Derived views are computed on first use and cached, so the plugins can
+    hand the same instance to every extractor; the BeautifulSoup tree is only
+    built if some lookup actually needs it.
+    """
+
+    __slots__ = ("html", "_lower", "_simple", "_soup", "_stripped_text")
+
+    def __init__(self, html: str) -> None:
+        self.html = html
+        self._lower: str | None = None
+        self._simple: bool | None = None
+        self._soup: BeautifulSoup | None = None
+        self._stripped_text: str | None = None
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.html.lower()
+        return self._lower
+
+    @property
+    def is_simple(self) -> bool:
+        """Whether a tag-level scan sees the same structure as html.parser."""
+
+        if self._simple is None:
+            self._simple = patterns.HTML_UNSAFE_CONSTRUCT.search(self.html) is None
+        return self._simple
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, "html.parser")
+        return self._soup
+
+    @property
+    def stripped_text(self) -> str:
+        """Equivalent of ``get_text(strip=True)`` for simple documents."""
+
+        if self._stripped_text is None:
+            self._stripped_text = fragment_stripped_text(self.html)
+        return self._stripped_text
+
+
+def fragment_text(fragment: str) -> str:
+    return "".join(_node_text(part) for part in patterns.HTML_TAG_QUOTED.split(fragment))
+
+
+def fragment_stripped_text(fragment: str) -> str:
+    return "".join(
+        piece
+        for piece in (_html.unescape(part).strip() for part in patterns.HTML_TAG_QUOTED.split(fragment))
+        if piece
+    )
+
+
+def _node_text(part: str) -> str:
+    # A whitespace-only text node is reduced to one newline or space.
+    text = _html.unescape(part)
+    if text and not text.strip(_ASCII_SPACES):
+        return "\n" if "\n" in text else " "
+    return text
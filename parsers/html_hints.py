@@ -0,0 +1,382 @@
+"""Targeted lookups in announcement HTML with a BeautifulSoup fallback.
+
+Every lookup first scans the raw markup with precompiled patterns. The scan
+only answers when the markup around its target is simple enough to be sure
+the answer matches what ``BeautifulSoup(..., "html.parser")`` would give;
+otherwise the document's shared soup is queried the slow way.
+"""
+
+from __future__ import annotations
+
+import html as _html
+from typing import Callable, TypeVar
+
+from bs4 import BeautifulSoup, Tag
+
+from . import patterns
+from .document import AnnouncementDocument, fragment_stripped_text, fragment_text
+
+T = TypeVar("T")
+
+_UNDECIDED = object()
+
+
+
+def paragraph_after_text(document: AnnouncementDocument, markers: tuple[str, ...]) -> str:
+    """Return the text of the first ``<p>`` after a text node equal to a marker.
+
+    Markers are tried in order; an empty string means none was found.
+    """
+
+    return _with_fallback(
+        document,
+        lambda: _fast_paragraph_after_text(document, markers),
+        lambda soup: _soup_paragraph_after_text(soup, markers),
+    )
+
+
+def rowspan_cell_texts(document: AnnouncementDocument, rowspans: tuple[str, ...]) -> list[str]:
+    """Return the texts of the ``<p>``/``<t>`` children of a ``rowspan`` cell.
+
+    The first ``<td>`` whose ``rowspan`` equals one of ``rowspans`` (tried in
+    order) is used; a child's first ``<span>`` wins over its full text.
+    """
+
+    return _with_fallback(
+        document,
+        lambda: _fast_rowspan_cell_texts(document, rowspans),
+        lambda soup: _soup_rowspan_cell_texts(soup, rowspans),
+    )
+
+
+def paragraph_following(document: AnnouncementDocument, marker: str) -> str | None:
+    """Return the stripped text of the ``<p>`` after the paragraph holding ``marker``."""
+
+    return _with_fallback(
+        document,
+        lambda: _fast_paragraph_following(document, marker),
+        lambda soup: _soup_paragraph_following(soup, marker),
+    )
+
+
+def table_time_cell_texts(document: AnnouncementDocument) -> list[str]:
+    """Return the stripped ``<p>`` texts of the ``rowspan`` cell in the second table row."""
+
+    return _with_fallback(
+        document,
+        lambda: _fast_table_time_cell_texts(document),
+        _soup_table_time_cell_texts,
+    )
+
+
+def heading_texts(document: AnnouncementDocument) -> list[tuple[str, str]]:
+    """Return ``(text, stripped text)`` for every ``<h1>`` in the document."""
+
+    return _with_fallback(
+        document,
+        lambda: _fast_heading_texts(document),
+        _soup_heading_texts,
+    )
+
+
+def first_img_src(document: AnnouncementDocument) -> str | None:
+    """Return the ``src`` of the first ``<img>``, if that image has one."""
+
+    return _with_fallback(
+        document,
+        lambda: _fast_first_img_src(document),
+        _soup_first_img_src,
+    )
+
+
+def _with_fallback(
+    document: AnnouncementDocument,
+    fast: Callable[[], object],
+    slow: Callable[[BeautifulSoup], T],
+) -> T:
+    result = fast() if document.is_simple else _UNDECIDED
+    if result is _UNDECIDED:
+        return slow(document.soup)
+    return result  # type: ignore[return-value]
+
+
+def _may_be_encoded(html: str) -> bool:
+    return "&#" in html
+
+
+def _closes_outer(fragment: str) -> bool:
+    """Whether ``fragment`` ends an element it did not start.
+
+    html.parser closes everything opened after that element as well, so the
+    element holding ``fragment`` may end early.
+    """
+
+    opened: list[str] = []
+    for tag in patterns.HTML_TAG_QUOTED.finditer(fragment):
+        match = patterns.HTML_TAG_NAME.match(tag.group())
+        if match is None:
+            continue
+        name = match.group(2).lower()
+        if not match.group(1):
+            opened.append(name)
+        elif name in opened:
+            del opened[len(opened) - 1 - opened[::-1].index(name):]
+        else:
+            return True
+    return False
+
+
+def _paragraphs_closed(tags: list[str]) -> bool:
+    """Whether ``<p``/``</p`` tags, in order, leave no paragraph open or unmatched."""
+
+    depth = 0
+    for tag in tags:
+        depth += -1 if tag.startswith("</") else 1
+        if not 0 <= depth <= 1:
+            return False
+    return depth == 0
+
+
+def _fast_paragraph_after_text(document: AnnouncementDocument, markers: tuple[str, ...]) -> object:
+    html = document.html
+    if _may_be_encoded(html):
+        return _UNDECIDED
+    for marker in markers:
+        if html.startswith(marker) or html.endswith(marker):
+            return _UNDECIDED
+        position = html.find(f">{marker}<")
+        if position < 0:
+            if marker in html:
+                return _UNDECIDED
+            continue
+        tag_start = html.rfind("<", 0, position)
+        if tag_start < 0 or patterns.HTML_TAG_QUOTED.fullmatch(html, tag_start, position + 1) is None:
+            return _UNDECIDED
+        opening = patterns.HTML_P_OPEN.search(html, position)
+        if opening is None:
+            return ""
+        closing = patterns.HTML_P_CLOSE.search(html, opening.end())
+        if closing is None:
+            return _UNDECIDED
+        body = html[opening.end():closing.start()]
+        if patterns.HTML_P_ANY.search(body) or _closes_outer(body):
+            return _UNDECIDED
+        return fragment_text(body)
+    return ""
+
+
+def _soup_paragraph_after_text(soup: BeautifulSoup, markers: tuple[str, ...]) -> str:
+    for marker in markers:
+        node = soup.find(string=marker)
+        if node:
+            paragraph = node.find_next("p")
+            return paragraph.get_text() if paragraph else ""
+    return ""
+
+
+def _fast_rowspan_cell_texts(document: AnnouncementDocument, rowspans: tuple[str, ...]) -> object:
+    html = document.html
+    occurrences = document.lower.count("rowspan")
+    if not occurrences:
+        return []
+    cells = list(patterns.HTML_TD_ROWSPAN_VALUE.finditer(html))
+    if len(cells) != occurrences:
+        return _UNDECIDED
+    cell = next(
+        (
+            match
+            for value in rowspans
+            for match in cells
+            if match.group(1) == value
+        ),
+        None,
+    )
+    if cell is None:
+        return []
+    closing = patterns.HTML_TD_CLOSE.search(html, cell.end())
+    if closing is None:
+        return _UNDECIDED
+    body = html[cell.end():closing.start()]
+    if patterns.HTML_TD_OR_TABLE.search(body) or _closes_outer(body):
+        return _UNDECIDED
+
+    texts: list[str] = []
+    position = 0
+    while True:
+        next_tag = body.find("<", position)
+        if next_tag < 0:
+            return texts
+        child = patterns.HTML_CELL_CHILD.match(body, next_tag)
+        if child is None:
+            return _UNDECIDED
+        name, content = child.group(1), child.group(2)
+        if patterns.HTML_CELL_CHILD_OPEN[name.lower()].search(content) or _closes_outer(content):
+            return _UNDECIDED
+        span = patterns.HTML_SPAN_ELEMENT.search(content)
+        if span is not None:
+            if patterns.HTML_SPAN_OPEN.search(span.group(1)):
+                return _UNDECIDED
+            texts.append(fragment_text(span.group(1)))
+        else:
+            texts.append(fragment_text(content))
+        position = child.end()
+
+
+def _soup_rowspan_cell_texts(soup: BeautifulSoup, rowspans: tuple[str, ...]) -> list[str]:
+    cell = None
+    for value in rowspans:
+        cell = soup.find("td", {"rowspan": value})
+        if cell is not None:
+            break
+    if cell is None:
+        return []
+    texts: list[str] = []
+    for child in cell.children:
+        if not isinstance(child, Tag):
+            continue
+        if child.name in {"p", "t"}:
+            span = child.find("span")
+            texts.append(span.get_text() if span else child.get_text())
+    return texts
+
+
+def _fast_paragraph_following(document: AnnouncementDocument, marker: str) -> object:
+    html = document.html
+    if _may_be_encoded(html):
+        return _UNDECIDED
+    position = html.find(marker)
+    if position < 0:
+        # A paragraph's stripped text is a substring of the document's.
+        return None if marker not in document.stripped_text else _UNDECIDED
+    if marker in fragment_stripped_text(html[:position]):
+        return _UNDECIDED
+    if html.rfind("<", 0, position) > html.rfind(">", 0, position):
+        return _UNDECIDED
+
+    opening = None
+    for match in patterns.HTML_P_OPEN.finditer(html, 0, position):
+        opening = match
+    if opening is None or patterns.HTML_P_CLOSE.search(html, opening.end(), position):
+        return _UNDECIDED
+    if _closes_outer(html[opening.end():position]):
+        return _UNDECIDED
+    if not _paragraphs_closed(patterns.HTML_P_ANY.findall(html, 0, opening.start())):
+        return _UNDECIDED
+
+    following = patterns.HTML_P_OPEN.search(html, opening.end())
+    if following is None:
+        return None
+    closing = patterns.HTML_P_CLOSE.search(html, following.end())
+    if closing is None:
+        return _UNDECIDED
+    body = html[following.end():closing.start()]
+    if patterns.HTML_P_ANY.search(body) or _closes_outer(body):
+        return _UNDECIDED
+    return fragment_stripped_text(body)
+
+
+def _soup_paragraph_following(soup: BeautifulSoup, marker: str) -> str | None:
+    for paragraph in soup.find_all("p"):
+        if marker in paragraph.get_text(strip=True):
+            following = paragraph.find_next("p")
+            return following.get_text(strip=True) if following else None
+    return None
+
+
+def _fast_table_time_cell_texts(document: AnnouncementDocument) -> object:
+    html = document.html
+    table = patterns.HTML_TABLE_OPEN.search(html)
+    if table is None:
+        return [] if "<table" not in document.lower else _UNDECIDED
+    table_end = patterns.HTML_TABLE_CLOSE.search(html, table.end())
+    if table_end is None:
+        return _UNDECIDED
+    table_body = html[table.end():table_end.start()]
+    if patterns.HTML_TABLE_OPEN.search(table_body):
+        return _UNDECIDED
+
+    tbody = patterns.HTML_TBODY_OPEN.search(table_body)
+    if tbody is None:
+        return []
+    tbody_end = patterns.HTML_TBODY_CLOSE.search(table_body, tbody.end())
+    if tbody_end is None:
+        return _UNDECIDED
+    rows = list(patterns.HTML_TR_OPEN.finditer(table_body, tbody.end(), tbody_end.start()))
+    if len(rows) < 2:
+        return []
+    row_end = patterns.HTML_TR_CLOSE.search(table_body, rows[1].end(), tbody_end.start())
+    if row_end is None:
+        return _UNDECIDED
+    row = table_body[rows[1].end():row_end.start()]
+    if patterns.HTML_TR_OPEN.search(row):
+        return _UNDECIDED
+
+    cell = patterns.HTML_TD_WITH_ROWSPAN.search(row)
+    if cell is None:
+        return [] if "rowspan" not in row.lower() else _UNDECIDED
+    cell_end = patterns.HTML_TD_CLOSE.search(row, cell.end())
+    if cell_end is None:
+        return _UNDECIDED
+    body = row[cell.end():cell_end.start()]
+    if patterns.HTML_TD_OR_TABLE.search(body) or _closes_outer(body):
+        return _UNDECIDED
+
+    paragraphs = [match.group(1) for match in patterns.HTML_P_ELEMENT.finditer(body)]
+    if any(patterns.HTML_P_ANY.search(content) for content in paragraphs):
+        return _UNDECIDED
+    if len(paragraphs) * 2 != len(patterns.HTML_P_ANY.findall(body)):
+        return _UNDECIDED
+    return [fragment_stripped_text(content) for content in paragraphs]
+
+
+def _soup_table_time_cell_texts(soup: BeautifulSoup) -> list[str]:
+    table = soup.find("table")
+    if table is None:
+        return []
+    tbody = table.find("tbody")
+    if tbody is None:
+        return []
+    rows = tbody.find_all("tr")
+    if len(rows) < 2:
+        return []
+    cell = rows[1].find("td", {"rowspan": True})
+    if cell is None:
+        return []
+    return [paragraph.get_text(strip=True) for paragraph in cell.find_all("p")]
+
+
+def _fast_heading_texts(document: AnnouncementDocument) -> object:
+    html = document.html
+    opening_count = len(patterns.HTML_H1_OPEN.findall(html))
+    if not opening_count:
+        return []
+    headings = [match.group(1) for match in patterns.HTML_H1_ELEMENT.finditer(html)]
+    if len(headings) != opening_count or any(map(_closes_outer, headings)):
+        return _UNDECIDED
+    return [(fragment_text(content), fragment_stripped_text(content)) for content in headings]
+
+
+def _soup_heading_texts(soup: BeautifulSoup) -> list[tuple[str, str]]:
+    return [
+        (heading.get_text(), heading.get_text(strip=True))
+        for heading in soup.find_all("h1")
+    ]
+
+
+def _fast_first_img_src(document: AnnouncementDocument) -> object:
+    html = document.html
+    image = patterns.HTML_IMG_TAG.search(html)
+    if image is None:
+        return None if "<img" not in document.lower else _UNDECIDED
+    source = patterns.HTML_SRC_ATTR.search(image.group(1))
+    if source is None:
+        return None if "src" not in image.group(1).lower() else _UNDECIDED
+    value = next(group for group in source.groups() if group is not None)
+    return _html.unescape(value)
+
+
+def _soup_first_img_src(soup: BeautifulSoup) -> str | None:
+    image = soup.find("img")
+    if image and "src" in image.attrs:
+        return image["src"]
+    return None
@@ -0,0 +1,108 @@
+"""Precompiled regular expressions shared by the parsers and game plugins.
+
+Patterns are compiled once at import time and referenced by name, so hot
+helpers do not go through ``re``'s pattern cache on every call.
+"""
+
+from __future__ import annotations
+
+import re
+
+# Generic text helpers.
+HTML_TAG = re.compile(r"<.*?>")
+HTML_TAG_NONEMPTY = re.compile(r"<[^>]+>")
+ESCAPED_HTML_TAG = re.compile(r"&lt;.*?&gt;")
+WHITESPACE_RUN = re.compile(r"\s+")
+DECIMAL = re.compile(r"-?\d+\.\d+")
+BRACKETED = re.compile(r"「([^」]+)」")
+BRACKETED_INNER = re.compile(r"(?<=「)[^」]*(?=」)")
+
+# Version codes and hints.
+VERSION_DECIMAL = re.compile(r"(\d+\.\d+)")
+VERSION_NUMBER = re.compile(r"(\d+\.?\d*)")
+VERSION_HINT = re.compile(r"(\d+\.\d+)\s*版本")
+MOON_VERSION = re.compile(r"月之[一二三四五六七八九十百零〇]+")
+GENSHIN_VERSION_HINT = re.compile(
+    r"(?:「|『)?((?:\d+\.\d+)|(?:月之[一二三四五六七八九十百零〇]+))(?:」|』)?版本"
+)
+
+# Genshin Impact.
+GENSHIN_EVENT_TIME = re.compile(r"\d{4}/\d{2}/\d{2} \d{2}:\d{2}")
+GENSHIN_WEAPON_NAME = re.compile(r"「[^」]*·([^」]*)」")
+GENSHIN_WISH_NAME = re.compile(r"「([^」]+)」祈愿")
+GENSHIN_CHARACTER_NAME = re.compile(r"·(.*)\(")
+
+# Honkai: Star Rail.
+STARRAIL_EVENT_TIME = re.compile(
+    r"<h1[^>]*>(?:活动时间|限时活动期)</h1>\s*<p[^>]*>(.*?)</p>",
+    re.DOTALL,
+)
+STARRAIL_GACHA_TIME = re.compile(r"时间为(.*?)，包含如下内容")
+STARRAIL_CHARACTER = re.compile(r"限定5星角色「([^（」]+)")
+STARRAIL_LIGHT_CONE = re.compile(r"限定5星光锥「([^（」]+)")
+
+# Zenless Zone Zero.
+ZENLESS_GACHA_NAME = re.compile(r"「([^」]+)」调频活动")
+ZENLESS_AGENT = re.compile(r"限定S级代理人.*?\[(.*?)\(.*?\)\]")
+ZENLESS_W_ENGINE = re.compile(r"限定S级音擎.*?\[(.*?)\(.*?\)\]")
+
+# Special program livestream notices.
+SPECIAL_PROGRAM_TIME = re.compile(
+    r"(?P<month>\d{1,2})\s*月\s*(?P<day>\d{1,2})\s*日(?:[^\d]|\s)*(?P<hour>\d{1,2}):(?P<minute>\d{2})"
+)
+
+# Raw announcement markup, scanned before the BeautifulSoup fallback.
+# A start/end tag, allowing quoted attribute values that contain ``>``.
+HTML_TAG_QUOTED = re.compile(r"""<[^>"']*(?:(?:"[^"]*"|'[^']*')[^>"']*)*>""")
+# Constructs where a plain tag scan may disagree with html.parser: comments,
+# raw-text and whitespace-preserving elements, a ``<`` that starts no tag or
+# sits inside one, and self-closed non-void tags.
+HTML_UNSAFE_CONSTRUCT = re.compile(
+    r"<!--|<!\[CDATA\[|<(?:script|style|template|pre|textarea)(?=[\s/>])"
+    r"|<(?!/?[A-Za-z])|<[^<>]*<"
+    r"|<(?!(?:area|base|br|col|embed|frame|hr|img|input|link|meta|param|source|track|wbr)"
+    r"(?=[\s/>]))[A-Za-z][^>]*/>",
+    re.IGNORECASE,
+)
+
+HTML_P_OPEN = re.compile(r"<p(?=[\s/>])[^>]*>", re.IGNORECASE)
+HTML_P_CLOSE = re.compile(r"</p\s*>", re.IGNORECASE)
+HTML_P_ANY = re.compile(r"</?p(?=[\s/>])", re.IGNORECASE)
+HTML_P_ELEMENT = re.compile(r"<p(?=[\s/>])[^>]*>(.*?)</p\s*>", re.IGNORECASE | re.DOTALL)
+
+HTML_TD_ROWSPAN_VALUE = re.compile(
+    r"""<td(?=[\s/>])[^>]*?\srowspan="(\d+)"[^>]*>""",
+    re.IGNORECASE,
+)
+HTML_TD_WITH_ROWSPAN = re.compile(r"<td(?=[\s/>])[^>]*?\srowspan\b[^>]*>", re.IGNORECASE)
+HTML_TD_CLOSE = re.compile(r"</td\s*>", re.IGNORECASE)
+HTML_TD_OR_TABLE = re.compile(r"<(?:td|table)(?=[\s/>])", re.IGNORECASE)
+HTML_CELL_CHILD = re.compile(
+    r"<(p|t)(?=[\s/>])[^>]*>(.*?)</\1\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+# Start of a nested ``<p>``/``<t>`` inside a cell child of the same name.
+HTML_CELL_CHILD_OPEN = {
+    "p": re.compile(r"<p(?=[\s/>])", re.IGNORECASE),
+    "t": re.compile(r"<t(?=[\s/>])", re.IGNORECASE),
+}
+HTML_SPAN_ELEMENT = re.compile(r"<span(?=[\s/>])[^>]*>(.*?)</span\s*>", re.IGNORECASE | re.DOTALL)
+HTML_SPAN_OPEN = re.compile(r"<span(?=[\s/>])", re.IGNORECASE)
+
+HTML_TABLE_OPEN = re.compile(r"<table(?=[\s/>])[^>]*>", re.IGNORECASE)
+HTML_TABLE_CLOSE = re.compile(r"</table\s*>", re.IGNORECASE)
+HTML_TBODY_OPEN = re.compile(r"<tbody(?=[\s/>])[^>]*>", re.IGNORECASE)
+HTML_TBODY_CLOSE = re.compile(r"</tbody\s*>", re.IGNORECASE)
+HTML_TR_OPEN = re.compile(r"<tr(?=[\s/>])[^>]*>", re.IGNORECASE)
+HTML_TR_CLOSE = re.compile(r"</tr\s*>", re.IGNORECASE)
+
+HTML_H1_OPEN = re.compile(r"<h1(?=[\s/>])", re.IGNORECASE)
+HTML_H1_ELEMENT = re.compile(r"<h1(?=[\s/>])[^>]*>(.*?)</h1\s*>", re.IGNORECASE | re.DOTALL)
+
+HTML_TAG_NAME = re.compile(r"<(/?)([A-Za-z][^\s/>]*)")
+
+HTML_IMG_TAG = re.compile(r"<img(?=[\s/>])([^>]*)>", re.IGNORECASE)
+HTML_SRC_ATTR = re.compile(
+    r"""(?:^|\s)src\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""",
+    re.IGNORECASE,
+)
@@ -2,25 +2,23 @@
 
 from __future__ import annotations
 
-import re
 from datetime import datetime
 
 from bs4 import BeautifulSoup
 
+from . import patterns
+
 
 def remove_html_tags(text: str) -> str:
-    clean = re.compile(r"<.*?>")
-    return re.sub(clean, "", text).strip()
+    return patterns.HTML_TAG.sub("", text).strip()
 
 
 def extract_floats(text: str) -> list[float]:
-    float_pattern = r"-?\d+\.\d+"
-    floats = re.findall(float_pattern, text)
-    return [float(value) for value in floats]
+    return [float(value) for value in patterns.DECIMAL.findall(text)]
 
 
 def extract_inner_text(text: str) -> str:
-    match = re.search(r"(?<=「)[^」]*(?=」)", text)
+    match = patterns.BRACKETED_INNER.search(text)
     return match.group(0) if match else ""
  
 
@@ -0,0 +1,83 @@
+"""Concurrent fetch stage feeding the per-game parse step."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, TypeVar
+
+from loguru import logger
+
+from clients import HoyolabClient, MiyousheClient
+from dto import SlimAnnContentRe, SlimAnnListRe
+from models.config import GameConfig
+from .special_program import SpecialProgramInfo, fetch_special_program_info
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class GamePayloads:
+    """Typed results of every remote request needed to update one game."""
+
+    ann_list: SlimAnnListRe
+    ann_content: SlimAnnContentRe
+    special_program: SpecialProgramInfo | None
+
+
+async def fetch_game_payloads(
+    *,
+    client: HoyolabClient,
+    events_client: MiyousheClient,
+    config: GameConfig,
+) -> GamePayloads:
+    """Start all independent requests for ``config`` at once.
+
+    None of the requests depends on another's result, so the stage takes
+    roughly as long as the slowest one. If one fails, the others are
+    cancelled and awaited before the error propagates.
+    """
+
+    latencies: dict[str, float] = {}
+    started = time.perf_counter()
+    tasks = [
+        asyncio.ensure_future(_timed("ann_list", client.fetch_ann_list(config), latencies)),
+        asyncio.ensure_future(_timed("ann_content", client.fetch_ann_content(config), latencies)),
+        asyncio.ensure_future(
+            _timed(
+                "special_program",
+                fetch_special_program_info(events_client, game_id=config.game_id),
+                latencies,
+            )
+        ),
+    ]
+    try:
+        ann_list, ann_content, special_program = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    wall = time.perf_counter() - started
+
+    logger.info(
+        "{game} fetched in {wall:.0f}ms ({detail}; sequential sum {total:.0f}ms)",
+        game=config.display_name,
+        wall=wall * 1000,
+        detail=", ".join(f"{name} {value * 1000:.0f}ms" for name, value in latencies.items()),
+        total=sum(latencies.values()) * 1000,
+    )
+    return GamePayloads(
+        ann_list=ann_list,
+        ann_content=ann_content,
+        special_program=special_program,
+    )
+
+
+async def _timed(name: str, awaitable: Awaitable[T], latencies: dict[str, float]) -> T:
+    started = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        latencies[name] = time.perf_counter() - started
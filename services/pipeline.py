@@ -3,19 +3,22 @@
 from __future__ import annotations
 
 import asyncio
-from copy import deepcopy
+import os
 from datetime import datetime, timedelta
 
 from loguru import logger
 
-from clients import HoyolabClient, MiyousheClient
-from games import get_plugin, load_game_configs
+from clients import HoyolabClient, HttpTransport, MiyousheClient, ResponseCache
+from games import get_plugin, load_game_configs, parse_game_announcements
 from models.config import GameConfig
+from models.version import VersionKey
 from exporters.ics import export_ics
 from . import storage
 from settings import Settings, get_settings
+from utils.executor import WorkerPool
+from utils.files import FileWriter
 from utils.logging import configure_logging
-from .special_program import fetch_special_program_info
+from .fetch import fetch_game_payloads
 
 
 async def run_pipeline(settings: Settings | None = None) -> None:
@@ -25,7 +28,17 @@ async def run_pipeline(settings: Settings | None = None) -> None:
     configs = load_game_configs()
     logger.info("Loaded {count} built-in game configuration(s)", count=len(configs))
 
-    async with HoyolabClient(settings) as client, MiyousheClient(settings) as events_client:
+    cache = ResponseCache(settings.http_cache_dir if settings.enable_http_cache else None)
+    writer = FileWriter()
+    workers = settings.executor_workers
+    if workers is None:
+        workers = min(len(configs), os.cpu_count() or 1)
+    async with (
+        WorkerPool(kind=settings.executor_kind, workers=workers) as pool,
+        HttpTransport(settings) as transport,
+        HoyolabClient(settings, transport=transport, cache=cache) as client,
+        MiyousheClient(settings, transport=transport, cache=cache) as events_client,
+    ):
         results = await asyncio.gather(
             *[
                 _process_game(
@@ -33,12 +46,29 @@ async def run_pipeline(settings: Settings | None = None) -> None:
                     events_client=events_client,
                     config=config,
                     settings=settings,
+                    pool=pool,
+                    writer=writer,
                 )
                 for config in configs
             ],
             return_exceptions=True,
         )
 
+    if cache.enabled:
+        logger.info("HTTP cache: {summary}", summary=cache.summary())
+
+    # One catalog write for every game that finished, even if another failed.
+    await storage.update_catalog(
+        settings.data_output_dir,
+        [
+            (config, result)
+            for config, result in zip(configs, results, strict=False)
+            if not isinstance(result, Exception)
+        ],
+        writer=writer,
+    )
+    logger.info("Output files: {summary}", summary=writer.summary())
+
     for config, result in zip(configs, results, strict=False):
         if isinstance(result, Exception):
             logger.error("Failed to update {game}: {error}", game=config.display_name, error=result)
@@ -51,20 +81,32 @@ async def _process_game(
     events_client: MiyousheClient,
     config: GameConfig,
     settings: Settings,
-) -> None:
+    pool: WorkerPool,
+    writer: FileWriter,
+) -> bool:
+
     logger.info("Updating {game}", game=config.display_name)
 
-    timeline = await storage.load_timeline(settings.data_output_dir, config.display_name)
-    before_snapshot = deepcopy(timeline.model_dump(mode="json", by_alias=True))
+    timeline = await storage.load_timeline(
+        settings.data_output_dir,
+        config.display_name,
+        snapshot=settings.enable_timeline_snapshot,
+    )
+    memo = (
+        await storage.load_parse_memo(settings.parse_memo_dir, config.display_name)
+        if settings.enable_parse_memo
+        else None
+    )
 
-    ann_list = await client.fetch_ann_list(config)
+    payloads = await fetch_game_payloads(
+        client=client,
+        events_client=events_client,
+        config=config,
+    )
     plugin = get_plugin(config.game_id)
-    version_info = plugin.extract_version(ann_list)
+    version_info = plugin.extract_version(payloads.ann_list)
 
-    special_program = await fetch_special_program_info(
-        events_client,
-        game_id=config.game_id,
-    )
+    special_program = payloads.special_program
     if special_program is not None and special_program.name != version_info.name:
         if special_program.code:
             version_info.next_version_code = special_program.code
@@ -75,7 +117,7 @@ async def _process_game(
         if special_program.start_time is not None:
             version_info.next_version_sp_time = special_program.start_time
 
-    current_version = timeline.upsert_version(
+    timeline.upsert_version(
         code=version_info.code,
         name=version_info.name,
         banner=version_info.banner,
@@ -97,15 +139,27 @@ async def _process_game(
             special_program_time=version_info.next_version_sp_time,
         )
 
-    ann_content = await client.fetch_ann_content(config)
-    existing_ids = {announcement.id for announcement in current_version.announcements}
-    new_announcements = plugin.parse_announcements(
-        version=version_info,
-        ann_list=ann_list,
-        ann_content=ann_content,
-        existing_ids=existing_ids,
-        display_name=config.display_name,
+    parsed, memo = await pool.run(
+        parse_game_announcements,
+        config.game_id,
+        version_info,
+        payloads.ann_list,
+        payloads.ann_content,
+        timeline.announcement_fingerprints(),
+        config.display_name,
+        memo,
+    )
+    logger.info(
+        "{game} announcements: {added} new, {updated} updated, {unchanged} unchanged",
+        game=config.display_name,
+        added=len(parsed.added),
+        updated=len(parsed.updated),
+        unchanged=parsed.unchanged,
     )
+    # Corrections stay with the stored copy's version, wherever they now start.
+    timeline.update_announcements(parsed.updated)
+
+    new_announcements = parsed.added
     current_announcements = new_announcements
     future_announcements = []
     if version_info.end_time is not None:
@@ -133,12 +187,23 @@ async def _process_game(
 
     trimmed_count, removed_versions = _prune_expired_entries(
         timeline,
-        active_version_code=version_info.code,
+        active_version=VersionKey.parse(version_info.code),
         active_version_start=version_info.start_time,
     )
 
-    after_snapshot = timeline.model_dump(mode="json", by_alias=True)
-    timeline_changed = before_snapshot != after_snapshot
+    changes = timeline.changes()
+    if changes:
+        logger.info(
+            "{game} timeline changes | versions +{versions_added} ~{versions_modified} "
+            "-{versions_removed} | announcements +{added} ~{modified} -{removed}",
+            game=config.display_name,
+            versions_added=len(changes.added_versions),
+            versions_modified=len(changes.modified_versions),
+            versions_removed=len(changes.removed_versions),
+            added=len(changes.announcements.added),
+            modified=len(changes.announcements.modified),
+            removed=len(changes.announcements.removed),
+        )
 
     if trimmed_count or removed_versions:
         logger.info(
@@ -148,14 +213,32 @@ async def _process_game(
             version_count=removed_versions,
         )
 
-    await storage.save_timeline(settings.data_output_dir, config.display_name, timeline)
-    storage.update_catalog(settings.data_output_dir, config, timeline_changed)
+    await storage.save_timeline(
+        settings.data_output_dir,
+        config.display_name,
+        timeline,
+        writer=writer,
+        snapshot=settings.enable_timeline_snapshot,
+    )
+    if memo is not None:
+        evicted = memo.retain_seen()
+        logger.info(
+            "{game} parse memo: {hits} hit(s), {misses} miss(es), {evicted} evicted",
+            game=config.display_name,
+            hits=memo.hits,
+            misses=memo.misses,
+            evicted=evicted,
+        )
+        if memo.changed:
+            await storage.save_parse_memo(settings.parse_memo_dir, config.display_name, memo)
 
     await export_ics(
         timeline=timeline,
         config=config,
         base_output=settings.ics_output_dir,
         extra_outputs=settings.extra_ics_dirs,
+        pool=pool,
+        writer=writer,
     )
 
     logger.info(
@@ -166,34 +249,36 @@ async def _process_game(
         trimmed=trimmed_count,
         removed_versions=removed_versions,
     )
+    return bool(changes)
 
 
 def _prune_expired_entries(
     timeline,
     *,
-    active_version_code: str,
+    active_version: VersionKey,
     active_version_start: datetime | None,
 ) -> tuple[int, int]:
     now = datetime.now()
+    expired: dict[int, set[int]] = {}
+    for version, announcement in timeline.ended_before(now):
+        expired.setdefault(id(version), set()).add(id(announcement))
+
     removed = 0
     remaining_versions = []
     removed_versions = 0
     for version in timeline.version_list:
-        if not version.announcements:
-            pass
-        else:
-            active_announcements = []
-            for announcement in version.announcements:
-                end_time = announcement.end_time
-                if end_time is not None and end_time < now:
-                    removed += 1
-                    continue
-                active_announcements.append(announcement)
-            if len(active_announcements) != len(version.announcements):
-                version.replace_announcements(active_announcements)
+        stale = expired.get(id(version))
+        if stale:
+            active_announcements = [
+                announcement
+                for announcement in version.announcements
+                if id(announcement) not in stale
+            ]
+            removed += len(version.announcements) - len(active_announcements)
+            version.replace_announcements(active_announcements)
 
         should_remove_version = False
-        if version.code != active_version_code:
+        if version.key != active_version:
             if version.end_time is not None:
                 past_active = (
                     active_version_start is not None
@@ -214,6 +299,6 @@ def _prune_expired_entries(
         remaining_versions.append(version)
 
     if removed_versions:
-        timeline.version_list = remaining_versions
+        timeline.replace_versions(remaining_versions)
 
     return removed, removed_versions
@@ -0,0 +1,62 @@
+"""Read-only queries over the stored game timelines."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Sequence
+
+from games import load_game_configs
+from models.config import GameConfig
+from models.game import Announcement, GameVersion
+from . import storage
+from settings import Settings, get_settings
+
+
+async def run_query(
+    settings: Settings | None = None,
+    *,
+    at: datetime | None = None,
+    days: int = 7,
+    games: Sequence[str] | None = None,
+) -> None:
+    """Print the events active at ``at`` and those starting in the next ``days``."""
+
+    settings = settings or get_settings()
+    moment = at or datetime.now()
+    horizon = moment + timedelta(days=days)
+
+    for config in _select_configs(games):
+        timeline = await storage.load_timeline(
+            settings.data_output_dir,
+            config.display_name,
+            snapshot=settings.enable_timeline_snapshot,
+        )
+        index = timeline.intervals()
+        print(f"== {config.display_name} ==")
+        _print_section(f"Active at {moment:%Y-%m-%d %H:%M}", index.active_at(moment))
+        _print_section(
+            f"Starting before {horizon:%Y-%m-%d %H:%M}",
+            index.starting_between(moment, horizon),
+        )
+
+
+def _select_configs(games: Sequence[str] | None) -> list[GameConfig]:
+    configs = load_game_configs()
+    if not games:
+        return configs
+    wanted = set(games)
+    return [
+        config
+        for config in configs
+        if config.display_name in wanted or config.game_id in wanted
+    ]
+
+
+def _print_section(heading: str, entries: list[tuple[GameVersion, Announcement]]) -> None:
+    print(f"{heading} ({len(entries)})")
+    for version, announcement in entries:
+        end = f"{announcement.end_time:%Y-%m-%d %H:%M}" if announcement.end_time else "?"
+        print(
+            f"  [{version.code}] {announcement.category:<6} "
+            f"{announcement.start_time:%Y-%m-%d %H:%M} ~ {end}  {announcement.title}"
+        )
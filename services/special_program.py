@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Optional
@@ -10,6 +9,7 @@ from typing import Any, Optional
 import pytz
 
 from clients.miyoushe import MiyousheClient
+from parsers import patterns
 from parsers.text import extract_floats, extract_inner_text, remove_html_tags
 
 _TZ = pytz.timezone("Asia/Shanghai")
@@ -36,10 +36,6 @@ _SOURCES = {
     "zzz": SpecialProgramSource(gids=8, type_id=3, page_size=40),
 }
 
-_TIME_PATTERN = re.compile(
-    r"(?P<month>\d{1,2})\s*月\s*(?P<day>\d{1,2})\s*日(?:[^\d]|\s)*(?P<hour>\d{1,2}):(?P<minute>\d{2})"
-)
-
 
 async def fetch_special_program_info(
     client: MiyousheClient,
@@ -112,7 +108,7 @@ def _extract_time_from_detail(detail_payload: dict[str, Any], anchor: Optional[d
     structured = post_meta.get("structured_content") or ""
     text_content = remove_html_tags(content) + " " + remove_html_tags(structured)
 
-    match = _TIME_PATTERN.search(text_content)
+    match = patterns.SPECIAL_PROGRAM_TIME.search(text_content)
     if not match:
         return None
 
@@ -178,14 +174,14 @@ def _extract_title_metadata(subject: str) -> tuple[Optional[str], Optional[str]]
     # 兼容两种格式：
     # 1. 「版本名」前瞻特别节目预告
     # 2. 「系列」—— 「版本名」前瞻特别节目预告
-    name_match = re.findall(r"「([^」]+)」", clean_subject)
+    name_match = patterns.BRACKETED.findall(clean_subject)
     if name_match:
         if "——" in clean_subject and len(name_match) > 1:
             # 取“——”前后第一对「」
             before_sep = clean_subject.split("——", 1)[0]
             after_sep = clean_subject.split("——", 1)[1]
-            before_match = re.findall(r"「([^」]+)」", before_sep)
-            after_match = re.findall(r"「([^」]+)」", after_sep)
+            before_match = patterns.BRACKETED.findall(before_sep)
+            after_match = patterns.BRACKETED.findall(after_sep)
             if before_match and after_match:
                 name = f"『{before_match[-1].strip()}』{after_match[0].strip()}"
             elif after_match:
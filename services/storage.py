@@ -2,60 +2,316 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import pickle
+from dataclasses import fields
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import aiofiles
+from loguru import logger
+from pydantic import TypeAdapter
+from typing_extensions import NotRequired, TypedDict
 
+from games.memo import ParseMemo
 from models.config import GameConfig
-from models.game import GameTimeline
+from models.game import Announcement, GameTimeline, GameVersion
+from utils.files import FileWriter
 
 
-async def load_timeline(base_dir: Path, display_name: str) -> GameTimeline:
+# JSON shape of ``data.json``. Pydantic only validates and serialises these
+# plain dicts; the pipeline itself works on the slotted ``models.game`` records.
+
+
+class _AnnouncementPayload(TypedDict):
+    id: int
+    title: str
+    description: str
+    game: str
+    start_time: datetime
+    end_time: NotRequired[datetime | None]
+    banner: NotRequired[str]
+    ann_type: str
+    fingerprint: NotRequired[str]
+
+
+class _VersionPayload(TypedDict):
+    name: str
+    code: str
+    banner: NotRequired[str]
+    start_time: NotRequired[datetime | None]
+    end_time: NotRequired[datetime | None]
+    sp_time: NotRequired[datetime | None]
+    ann_list: NotRequired[list[_AnnouncementPayload]]
+
+
+class _TimelinePayload(TypedDict):
+    version_list: NotRequired[list[_VersionPayload]]
+
+
+_TIMELINE_ADAPTER = TypeAdapter(_TimelinePayload)
+
+
+def _timeline_from_payload(payload: _TimelinePayload) -> GameTimeline:
+    return GameTimeline(
+        version_list=[
+            GameVersion(
+                name=version["name"],
+                code=version["code"],
+                banner=version.get("banner", ""),
+                start_time=version.get("start_time"),
+                end_time=version.get("end_time"),
+                special_program_time=version.get("sp_time"),
+                announcements=[
+                    Announcement(
+                        id=announcement["id"],
+                        title=announcement["title"],
+                        description=announcement["description"],
+                        game=announcement["game"],
+                        category=announcement["ann_type"],
+                        start_time=announcement["start_time"],
+                        end_time=announcement.get("end_time"),
+                        banner=announcement.get("banner", ""),
+                        fingerprint=announcement.get("fingerprint", ""),
+                    )
+                    for announcement in version.get("ann_list", ())
+                ],
+            )
+            for version in payload.get("version_list", ())
+        ]
+    )
+
+
+def _timeline_to_payload(timeline: GameTimeline) -> _TimelinePayload:
+    return {
+        "version_list": [
+            {
+                "name": version.name,
+                "code": version.code,
+                "banner": version.banner,
+                "start_time": version.start_time,
+                "end_time": version.end_time,
+                "sp_time": version.special_program_time,
+                "ann_list": [
+                    {
+                        "id": announcement.id,
+                        "title": announcement.title,
+                        "description": announcement.description,
+                        "game": announcement.game,
+                        "start_time": announcement.start_time,
+                        "end_time": announcement.end_time,
+                        "banner": announcement.banner,
+                        "ann_type": announcement.category,
+                        "fingerprint": announcement.fingerprint,
+                    }
+                    for announcement in version.announcements
+                ],
+            }
+            for version in timeline.version_list
+        ]
+    }
+
+
+# ``data.snapshot`` beside ``data.json``: a pickle of the timeline as plain
+# tuples, headed by digests of the JSON it was taken from and of the pickle.
+# It is an opt-in local cache (never published), written only when a timeline
+# is saved, and is only used when the JSON on disk is byte-for-byte the one it
+# was taken from.
+
+_SNAPSHOT_MAGIC = b"HTS1"
+_DIGEST_SIZE = hashlib.sha256().digest_size
+_SNAPSHOT_HEADER_SIZE = len(_SNAPSHOT_MAGIC) + 2 * _DIGEST_SIZE
+
+_ANNOUNCEMENT_FIELDS = tuple(item.name for item in fields(Announcement) if item.init)
+_VERSION_FIELDS = tuple(
+    item.name for item in fields(GameVersion) if item.init and item.name != "announcements"
+)
+# Changing either record's fields invalidates every snapshot.
+_SNAPSHOT_LAYOUT = repr((_VERSION_FIELDS, _ANNOUNCEMENT_FIELDS)).encode("utf-8")
+
+_announcement_row = attrgetter(*_ANNOUNCEMENT_FIELDS)
+_version_row = attrgetter(*_VERSION_FIELDS)
+
+_SnapshotRows = list[tuple[tuple[Any, ...], list[tuple[Any, ...]]]]
+
+
+def _source_digest(content: bytes) -> bytes:
+    digest = hashlib.sha256(_SNAPSHOT_LAYOUT)
+    digest.update(content)
+    return digest.digest()
+
+
+def _timeline_to_rows(timeline: GameTimeline) -> _SnapshotRows:
+    return [
+        (
+            _version_row(version),
+            [_announcement_row(announcement) for announcement in version.announcements],
+        )
+        for version in timeline.version_list
+    ]
+
+
+def _timeline_from_rows(rows: _SnapshotRows) -> GameTimeline:
+    # Trusted construction: the rows were written from a timeline that
+    # produced exactly the JSON they are checked against.
+    return GameTimeline(
+        version_list=[
+            GameVersion(
+                **dict(zip(_VERSION_FIELDS, version_row)),
+                announcements=[Announcement(*row) for row in announcement_rows],
+            )
+            for version_row, announcement_rows in rows
+        ]
+    )
+
+
+async def _load_snapshot(path: Path, content: bytes) -> GameTimeline | None:
+    if not path.exists():
+        return None
+    try:
+        async with aiofiles.open(path, "rb") as handle:
+            snapshot = await handle.read()
+    except OSError as exc:
+        logger.debug("Could not read timeline snapshot {path}: {error}", path=path, error=exc)
+        return None
+    magic = snapshot[: len(_SNAPSHOT_MAGIC)]
+    source = snapshot[len(_SNAPSHOT_MAGIC) : len(_SNAPSHOT_MAGIC) + _DIGEST_SIZE]
+    checksum = snapshot[len(_SNAPSHOT_MAGIC) + _DIGEST_SIZE : _SNAPSHOT_HEADER_SIZE]
+    body = snapshot[_SNAPSHOT_HEADER_SIZE:]
+    if magic != _SNAPSHOT_MAGIC or source != _source_digest(content):
+        logger.debug("Timeline snapshot {path} is stale", path=path)
+        return None
+    try:
+        if checksum != hashlib.sha256(body).digest():
+            raise ValueError("checksum mismatch")
+        return _timeline_from_rows(pickle.loads(body))
+    except Exception as exc:  # truncated or corrupt file, foreign pickle, ...
+        logger.debug("Discarding timeline snapshot {path}: {error}", path=path, error=exc)
+        path.unlink(missing_ok=True)
+        return None
+
+
+async def _save_snapshot(
+    path: Path, content: bytes, timeline: GameTimeline, writer: FileWriter
+) -> bool:
+    header = _SNAPSHOT_MAGIC + _source_digest(content)
+    try:
+        if path.exists():
+            async with aiofiles.open(path, "rb") as handle:
+                if await handle.read(len(header)) == header:
+                    return False
+        body = pickle.dumps(_timeline_to_rows(timeline), protocol=pickle.HIGHEST_PROTOCOL)
+        return await writer.write(path, header + hashlib.sha256(body).digest() + body)
+    except OSError as exc:  # the snapshot is only a cache
+        logger.debug("Could not write timeline snapshot {path}: {error}", path=path, error=exc)
+        return False
+
+
+async def load_timeline(
+    base_dir: Path,
+    display_name: str,
+    *,
+    snapshot: bool = False,
+) -> GameTimeline:
+    """Load ``data.json``; with ``snapshot``, prefer a matching ``data.snapshot``.
+
+    A missing, stale or unreadable snapshot falls back to validating the
+    JSON. Loading never writes a snapshot; :func:`save_timeline` does.
+    """
+
     timeline_path = base_dir / display_name / "data.json"
     if not timeline_path.exists():
         return GameTimeline()
-    async with aiofiles.open(timeline_path, "r", encoding="utf-8") as handle:
+    async with aiofiles.open(timeline_path, "rb") as handle:
         content = await handle.read()
     if not content.strip():
         return GameTimeline()
-    payload = json.loads(content)
-    return GameTimeline.model_validate(payload)
+    if snapshot:
+        timeline = await _load_snapshot(timeline_path.with_name("data.snapshot"), content)
+        if timeline is not None:
+            return timeline
+    return _timeline_from_payload(_TIMELINE_ADAPTER.validate_json(content))
 
 
-async def save_timeline(base_dir: Path, display_name: str, timeline: GameTimeline) -> None:
+async def save_timeline(
+    base_dir: Path,
+    display_name: str,
+    timeline: GameTimeline,
+    *,
+    writer: FileWriter | None = None,
+    snapshot: bool = False,
+) -> bool:
     target_dir = base_dir / display_name
     target_dir.mkdir(parents=True, exist_ok=True)
-    timeline_path = target_dir / "data.json"
-    async with aiofiles.open(timeline_path, "w", encoding="utf-8") as handle:
-        await handle.write(
-            json.dumps(timeline.model_dump(mode="json", by_alias=True), ensure_ascii=False)
-        )
+    body = json.dumps(
+        _TIMELINE_ADAPTER.dump_python(_timeline_to_payload(timeline), mode="json"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+    writer = writer if writer is not None else FileWriter()
+    changed = await writer.write(target_dir / "data.json", body)
+    if snapshot:
+        await _save_snapshot(target_dir / "data.snapshot", body, timeline, writer)
+    return changed
 
 
-def update_catalog(base_dir: Path, config: GameConfig, timeline_changed: bool) -> None:
-    catalog_path = base_dir / "data.json"
-    if catalog_path.exists():
-        catalog = json.loads(catalog_path.read_text(encoding="utf-8"))
-    else:
-        catalog = {"games": [], "icons": [], "update_time": 0}
+async def load_parse_memo(memo_dir: Path, display_name: str) -> ParseMemo:
+    memo_path = memo_dir / f"{display_name}.json"
+    if not memo_path.exists():
+        return ParseMemo()
+    async with aiofiles.open(memo_path, "r", encoding="utf-8") as handle:
+        content = await handle.read()
+    try:
+        payload = json.loads(content)
+    except json.JSONDecodeError:
+        return ParseMemo()
+    return ParseMemo.from_payload(payload)
+
 
-    if "games" not in catalog:
-        catalog["games"] = []
-    if "icons" not in catalog:
-        catalog["icons"] = []
-    if "update_time" not in catalog:
-        catalog["update_time"] = 0
+async def save_parse_memo(
+    memo_dir: Path,
+    display_name: str,
+    memo: ParseMemo,
+    *,
+    writer: FileWriter | None = None,
+) -> bool:
+    memo_dir.mkdir(parents=True, exist_ok=True)
+    body = json.dumps(memo.to_payload(), ensure_ascii=False)
+    writer = writer if writer is not None else FileWriter()
+    return await writer.write(memo_dir / f"{display_name}.json", body.encode("utf-8"))
 
-    if config.display_name not in catalog["games"]:
-        catalog["games"].append(config.display_name)
-    if config.icon not in catalog["icons"]:
-        catalog["icons"].append(config.icon)
 
-    if timeline_changed:
-        catalog["update_time"] = int(datetime.now().timestamp())
+async def update_catalog(
+    base_dir: Path,
+    updates: Iterable[tuple[GameConfig, bool]],
+    *,
+    writer: FileWriter | None = None,
+) -> bool:
+    """Apply every game's ``(config, timeline_changed)`` to the catalog in one write.
+
+    The pipeline collects these while the games run and calls this once at
+    the end, so concurrent games never read-modify-write the file themselves.
+    """
+
+    catalog_path = base_dir / "data.json"
+    catalog: dict[str, Any] = {}
+    if catalog_path.exists():
+        async with aiofiles.open(catalog_path, "r", encoding="utf-8") as handle:
+            catalog = json.loads(await handle.read())
+    catalog.setdefault("games", [])
+    catalog.setdefault("icons", [])
+    catalog.setdefault("update_time", 0)
+
+    for config, timeline_changed in updates:
+        if config.display_name not in catalog["games"]:
+            catalog["games"].append(config.display_name)
+        if config.icon not in catalog["icons"]:
+            catalog["icons"].append(config.icon)
+        if timeline_changed:
+            catalog["update_time"] = int(datetime.now().timestamp())
 
     catalog_path.parent.mkdir(parents=True, exist_ok=True)
-    catalog_path.write_text(json.dumps(catalog, ensure_ascii=False), encoding="utf-8")
+    writer = writer if writer is not None else FileWriter()
+    return await writer.write(catalog_path, json.dumps(catalog, ensure_ascii=False).encode("utf-8"))
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Annotated, List
+from typing import Annotated, List, Literal, Optional
 
 from pydantic import BaseModel, Field, validator
 
@@ -28,6 +28,37 @@ class Settings(BaseModel):
         default_factory=lambda: _default_repo_root() / "mocks"
     )
     http_timeout_seconds: Annotated[float, Field(gt=0)] = 15.0
+    http2_enabled: bool = Field(default=True)
+    http_max_connections: Annotated[int, Field(gt=0)] = 20
+    http_max_connections_per_host: Annotated[int, Field(gt=0)] = 6
+    http_max_keepalive_connections: Annotated[int, Field(ge=0)] = 10
+    http_keepalive_expiry_seconds: Annotated[float, Field(ge=0)] = 30.0
+    http_retries: Annotated[int, Field(ge=1)] = 3
+    http_backoff_base_seconds: Annotated[float, Field(ge=0)] = 1.0
+    http_backoff_max_seconds: Annotated[float, Field(ge=0)] = 8.0
+    http_backoff_jitter: Annotated[float, Field(ge=0, le=1)] = 0.5
+    circuit_breaker_failure_threshold: Annotated[int, Field(ge=1)] = 5
+    circuit_breaker_reset_seconds: Annotated[float, Field(ge=0)] = 60.0
+    http_hedge_enabled: bool = Field(default=False)
+    http_hedge_percentile: Annotated[float, Field(gt=0, le=100)] = 95.0
+    http_hedge_min_samples: Annotated[int, Field(ge=1)] = 5
+    http_hedge_delay_seconds: Optional[Annotated[float, Field(gt=0)]] = 3.0
+    strict_payload_validation: bool = Field(default=False)
+    enable_http_cache: bool = Field(default=True)
+    http_cache_dir: Path = Field(
+        default_factory=lambda: _default_repo_root() / ".cache" / "http"
+    )
+    enable_parse_memo: bool = Field(default=True)
+    parse_memo_dir: Path = Field(
+        default_factory=lambda: _default_repo_root() / ".cache" / "parse_memo"
+    )
+    enable_timeline_snapshot: bool = Field(default=False)
+    # Threads by default: spawned processes must import bs4, pydantic and
+    # icalendar before doing any work, which costs far more than the parsing
+    # they would offload on feeds of today's size. Threads still keep that
+    # work off the event loop; use processes for large feeds on many cores.
+    executor_kind: Literal["process", "thread"] = "thread"
+    executor_workers: Optional[Annotated[int, Field(ge=0)]] = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -36,6 +67,8 @@ class Settings(BaseModel):
         "data_output_dir",
         "ics_output_dir",
         "debug_data_dir",
+        "http_cache_dir",
+        "parse_memo_dir",
         each_item=False,
     )
     def _expand_path(cls, value: Path) -> Path:  # noqa: D401
@@ -0,0 +1,58 @@
+"""Plugin hint extractors keep the output of the BeautifulSoup-only code.
+
+Every ``fixtures/announcements/*.html`` body follows the publishers' markup,
+and ``expected.json`` holds what the extractors of the baseline tree
+(commit 07961bb, one ``BeautifulSoup`` per call) returned for it.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from games import genshin, starrail, zenless
+from parsers.document import AnnouncementDocument
+
+FIXTURES = Path(__file__).parent / "fixtures" / "announcements"
+EXPECTED = json.loads((FIXTURES / "expected.json").read_text(encoding="utf-8"))
+
+
+def _genshin(html: str) -> dict[str, object]:
+    return {
+        "event_start_hint": genshin._event_time_hints(AnnouncementDocument(html))[0],
+        "gacha_start_hint": genshin._gacha_time_hints(AnnouncementDocument(html))[0],
+    }
+
+
+def _zenless(html: str) -> dict[str, object]:
+    record = SimpleNamespace(banner="")
+    return {
+        "event_time_range": list(zenless._event_time_hints(AnnouncementDocument(html))),
+        "gacha_time_range": list(zenless._gacha_time_hints(AnnouncementDocument(html))),
+        "gacha_banner": zenless._gacha_banner(record, None, AnnouncementDocument(html)),
+    }
+
+
+def _starrail(html: str) -> dict[str, object]:
+    return {
+        "event_start_hint": starrail._event_time_hints(AnnouncementDocument(html))[0],
+        "gacha_start_hint": starrail._gacha_time_hints(AnnouncementDocument(html))[0],
+        "gacha_title": starrail._format_gacha_title("跃迁", None, AnnouncementDocument(html)),
+    }
+
+
+EXTRACTORS = {"genshin": _genshin, "zenless": _zenless, "starrail": _starrail}
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED))
+def test_hints_match_the_baseline_extractors(name: str) -> None:
+    html = (FIXTURES / name).read_text(encoding="utf-8")
+    extract = EXTRACTORS[name.split("_")[0]]
+    assert extract(html) == EXPECTED[name]
+
+
+def test_every_fixture_has_expectations() -> None:
+    assert sorted(path.name for path in FIXTURES.glob("*.html")) == sorted(EXPECTED)
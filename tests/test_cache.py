@@ -0,0 +1,100 @@
+"""Conditional GETs and decoded-DTO reuse in ``clients.cache.ResponseCache``."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import httpx
+from pydantic import BaseModel
+
+from clients.cache import ResponseCache
+
+URL = "https://example.invalid/ann_list"
+BODY = b'{"value": 1}'
+
+
+validations: list[str] = []
+
+
+class Payload(BaseModel):
+    value: int
+
+    @classmethod
+    def model_validate_json(cls, *args, **kwargs):
+        validations.append(cls.__name__)
+        return super().model_validate_json(*args, **kwargs)
+
+
+class FloatPayload(BaseModel):
+    value: float
+
+
+class StubTransport:
+    """Answers with ``BODY`` and an ETag, or ``304`` when the ETag is echoed."""
+
+    def __init__(self, headers: dict[str, str] | None = None) -> None:
+        self.headers = {"ETag": '"v1"'} if headers is None else headers
+        self.requests: list[dict[str, str]] = []
+
+    async def get(self, url, *, params=None, headers=None) -> httpx.Response:
+        self.requests.append(dict(headers or {}))
+        request = httpx.Request("GET", url)
+        if self.headers and (headers or {}).get("If-None-Match") == self.headers.get("ETag"):
+            return httpx.Response(304, request=request)
+        return httpx.Response(200, content=BODY, headers=self.headers, request=request)
+
+
+def _get_model(cache: ResponseCache, transport: StubTransport, model: type[BaseModel]):
+    return asyncio.run(cache.get_model(transport, URL, model))
+
+
+def test_not_modified_reuses_the_validated_model(tmp_path: Path) -> None:
+    transport = StubTransport()
+    validations.clear()
+
+    first = _get_model(ResponseCache(tmp_path), transport, Payload)
+    cache = ResponseCache(tmp_path)
+    second = _get_model(cache, transport, Payload)
+
+    assert first == second == Payload(value=1)
+    assert validations == ["Payload"]
+    assert cache.hits == 1
+    assert transport.requests[-1]["If-None-Match"] == '"v1"'
+
+
+def test_a_different_model_validates_the_cached_body(tmp_path: Path) -> None:
+    transport = StubTransport()
+    _get_model(ResponseCache(tmp_path), transport, Payload)
+
+    value = _get_model(ResponseCache(tmp_path), transport, FloatPayload)
+
+    assert type(value) is FloatPayload
+    assert value.value == 1.0
+
+
+def test_unreadable_body_counts_as_a_miss(tmp_path: Path, monkeypatch) -> None:
+    transport = StubTransport()
+    _get_model(ResponseCache(tmp_path), transport, Payload)
+    read_bytes = Path.read_bytes
+
+    def failing_read_bytes(path: Path) -> bytes:
+        if path.suffix == ".body":
+            raise OSError("disk error")
+        return read_bytes(path)
+
+    monkeypatch.setattr(Path, "read_bytes", failing_read_bytes)
+
+    cache = ResponseCache(tmp_path)
+    assert asyncio.run(cache.get(transport, URL)) == BODY
+    assert cache.misses == 1
+    assert "If-None-Match" not in transport.requests[-1]
+
+
+def test_response_without_validators_drops_the_entry(tmp_path: Path) -> None:
+    _get_model(ResponseCache(tmp_path), StubTransport(), Payload)
+    assert {path.suffix for path in tmp_path.iterdir()} == {".json", ".body", ".model"}
+
+    _get_model(ResponseCache(tmp_path), StubTransport(headers={}), Payload)
+
+    assert list(tmp_path.iterdir()) == []
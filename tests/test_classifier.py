@@ -0,0 +1,61 @@
+"""``TitleClassifier`` must match titles exactly like plain substring tests."""
+
+from __future__ import annotations
+
+import random
+
+from parsers.classifier import TitleClassifier, TitleRule
+
+ALPHABET = "版本活动祈愿跃迁调频限时「」·ab"
+
+
+def _keyword(rng: random.Random) -> str:
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 3)))
+
+
+def _rules(rng: random.Random, count: int) -> list[TitleRule]:
+    return [
+        TitleRule(
+            name=f"rule-{index}",
+            category=rng.choice(["event", "gacha"]),
+            all_of=tuple(_keyword(rng) for _ in range(rng.randint(0, 2))),
+            any_of=tuple(_keyword(rng) for _ in range(rng.randint(0, 3))),
+            none_of=tuple(_keyword(rng) for _ in range(rng.randint(0, 2))),
+            tag=rng.choice([None, None, "活动", "扭蛋"]),
+        )
+        for index in range(count)
+    ]
+
+
+def _expected(rules: list[TitleRule], title: str, tag: str | None) -> list[str]:
+    return [
+        rule.name
+        for rule in rules
+        if (rule.tag is None or rule.tag == tag)
+        and all(keyword in title for keyword in rule.all_of)
+        and not any(keyword in title for keyword in rule.none_of)
+        and (not rule.any_of or any(keyword in title for keyword in rule.any_of))
+    ]
+
+
+def test_automaton_classifier_matches_substring_tests() -> None:
+    rng = random.Random(13)
+    for _ in range(20):
+        rules = _rules(rng, 60)
+        classifier = TitleClassifier(rules)
+        assert classifier._automaton is not None
+        for _ in range(200):
+            title = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 24)))
+            tag = rng.choice([None, "活动", "扭蛋"])
+            markup = f"<p>{title[:5]}</p>{title[5:]}"
+            expected = _expected(rules, title, tag)
+            assert [item.rule for item in classifier.classify_all(markup, tag=tag)] == expected
+            first = classifier.classify(markup, tag=tag)
+            assert first.title == title
+            assert first.rule == (expected[0] if expected else None)
+
+
+def test_small_rule_sets_skip_the_automaton() -> None:
+    classifier = TitleClassifier([TitleRule("warp", "gacha", all_of=("跃迁",))])
+    assert classifier._automaton is None
+    assert classifier.classify("「蝶立锋锷」跃迁").rule == "warp"
@@ -0,0 +1,116 @@
+"""The raw-markup scans in ``parsers.html_hints`` must agree with BeautifulSoup.
+
+Every public lookup is compared with its ``_soup_*`` reference on a freshly
+parsed tree, over announcement bodies in the publishers' markup, fragments
+that once made the scans disagree, and documents spliced from both.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+from bs4 import BeautifulSoup
+
+from parsers import html_hints
+from parsers.document import AnnouncementDocument
+
+LOOKUPS = [
+    ("paragraph_after_text", (("〓获取奖励时限〓", "〓活动时间〓"),)),
+    ("rowspan_cell_texts", (("3", "5", "9"),)),
+    ("paragraph_following", ("【活动时间】",)),
+    ("table_time_cell_texts", ()),
+    ("heading_texts", ()),
+    ("first_img_src", ()),
+]
+
+ANNOUNCEMENTS = [
+    # Genshin event: marker paragraph, then the time range.
+    '<p style="white-space: pre-wrap;"><span style="color:rgba(255,215,0,1);">〓活动时间〓</span></p>'
+    '<p style="white-space: pre-wrap;">2026/10/12 10:00 ~ 2026/10/26 03:59</p>'
+    '<p style="white-space: pre-wrap;">&nbsp;</p>'
+    '<p style="white-space: pre-wrap;"><span style="color:rgba(255,215,0,1);">〓活动说明〓</span></p>'
+    '<p style="white-space: pre-wrap;">活动期间，旅行者可前往「秋日游园」参与挑战。</p>',
+    # Genshin event whose reward window starts at the version update.
+    "<p>〓获取奖励时限〓</p>"
+    '<p><span style="color:rgba(255,215,0,1);">「月之九」版本更新后</span> ~ 2026/11/18 03:59</p>'
+    "<p>〓活动时间〓</p><p>2026/10/01 11:00 ~ 2026/11/18 03:59</p>",
+    # Genshin wish: table with the time cell spanning several rows.
+    '<table border="1"><colgroup><col width="138"><col width="138"></colgroup><tbody>'
+    '<tr><td><p style="text-align: center;">祈愿时间</p></td>'
+    '<td><p style="text-align: center;">5星角色</p></td></tr>'
+    '<tr><td rowspan="3"><p style="text-align: center;">'
+    '<t class="t_lc"><span>「月之九」版本更新后</span></t></p>'
+    '<p style="text-align: center;">~</p>'
+    '<p style="text-align: center;"><t class="t_gl">2026/10/21 17:59</t></p></td>'
+    '<td><p style="text-align: center;">「烈焰耀千灯」玛薇卡</p></td></tr></tbody></table>',
+    # Star Rail wish: the title lives in the headings.
+    '<h1 style="text-align: center;"><span style="color:rgba(255,211,85,1);">「蝶立锋锷」</span>'
+    "活动跃迁</h1><h1> <b>「某某」</b> 限定5星角色 </h1>"
+    "<p>活动期间，限定5星角色「希儿（量子）」的跃迁概率将大幅提升！</p><br />",
+    # Zenless event: marker paragraph, banner image and a time table.
+    '<p><img src="https://fastcdn.example.com/upload/2026/10/banner.png?x-oss-process=image&amp;w=1080" />'
+    "</p><p>【活动时间】</p><p> 2026/10/20 18:00:00 - 2026/11/03 11:59:59（服务器时间） </p>"
+    "<p>【活动说明】</p><p>活动期间，绳匠可参与「限时挑战」。</p>",
+    '<table><tbody><tr><td>开启时间</td><td>调频代理人</td></tr>'
+    '<tr><td rowspan="2"><p>2.3版本更新后</p><p>\n</p><p>2026/10/29 19:59</p></td>'
+    "<td><p>柏妮思</p></td></tr></tbody></table>",
+]
+
+# Fragments on which the scans once disagreed with BeautifulSoup.
+EDGE_CASES = [
+    "<h1>  </h1>",
+    "<h1>\n \t</h1><h1> a </h1>",
+    "<span>〓活动时间〓<p ></span> </p>",
+    "</p ><p><p/>【活动时间】",
+    "〓活动时间〓<p>〓活动时间〓</p><p>\n</p>",
+    "<p>〓活动时间〓</p><p> <span> </span> \t</p>",
+    "<p>〓活动时间〓</p><p>&#32;</p>",
+    "<span><h1>x</span>y</h1>",
+    '<td rowspan="3"><span><p>a</span></p></td>',
+    '<td rowspan="3"><p> </p><t>\n</t><p>a<p>b</p></p></td>',
+    '<p>【活动时间】</p><p><span>2026/10/20</p></span>',
+    '</x \n<img src="a.png">',
+    '</<img src="a.png">',
+    "<pre>〓活动时间〓</pre><pre>  </pre>",
+]
+
+PIECES = [
+    "<p>〓活动时间〓</p>", "<p>【活动时间】</p>", "<p>2026/01/02 10:00 ~ 2026/02/01 03:59</p>",
+    "<p>  </p>", "<p>\n</p>", "<p/>", "</p>", "<p>", "</span>", "<span>", "<br/>", " ", "\n",
+    "<h1>  </h1>", "<h1>「甲」活动跃迁</h1>", '<td rowspan="3"><p>x</p></td>', "<!-- c -->",
+    '<img src="a.png">', "<textarea> </textarea>", "〓活动时间〓", "&nbsp;", "<i/>",
+]
+
+
+def _assert_same(html: str) -> None:
+    soup = BeautifulSoup(html, "html.parser")
+    for name, args in LOOKUPS:
+        fast = getattr(html_hints, name)(AnnouncementDocument(html), *args)
+        reference = getattr(html_hints, f"_soup_{name}")(soup, *args)
+        assert fast == reference, (name, html)
+
+
+@pytest.mark.parametrize("html", ANNOUNCEMENTS + EDGE_CASES)
+def test_lookups_match_beautifulsoup(html: str) -> None:
+    _assert_same(html)
+
+
+def test_lookups_match_beautifulsoup_on_spliced_documents() -> None:
+    rng = random.Random(8)
+    sources = ANNOUNCEMENTS + EDGE_CASES + PIECES
+    for _ in range(2000):
+        html = "".join(rng.choice(sources) for _ in range(rng.randint(1, 6)))
+        _assert_same(html)
+    for announcement in ANNOUNCEMENTS:
+        for _ in range(50):
+            cut = rng.randint(0, len(announcement))
+            _assert_same(announcement[:cut] + rng.choice(PIECES) + announcement[cut:])
+
+
+def test_simple_announcements_skip_the_soup() -> None:
+    for html in ANNOUNCEMENTS:
+        document = AnnouncementDocument(html)
+        for name, args in LOOKUPS:
+            getattr(html_hints, name)(document, *args)
+        assert document._soup is None, html
@@ -0,0 +1,84 @@
+"""Half-open behaviour of the per-host circuit breaker."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from clients.resilience import CircuitBreaker, CircuitOpenError, ResilientRequester
+from settings import Settings
+
+URL = "https://example.invalid/ann_list"
+HOST = "example.invalid"
+
+
+def _open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0)
+    breaker.record_failure(HOST)
+    return breaker
+
+
+def test_half_open_admits_a_single_probe() -> None:
+    breaker = _open_breaker()
+
+    assert breaker.allow(HOST)
+    assert not breaker.allow(HOST)
+
+    breaker.record_failure(HOST)
+    assert breaker.allow(HOST)
+    breaker.record_success(HOST)
+    assert breaker.allow(HOST)
+    assert breaker.allow(HOST)
+
+
+def test_other_callers_wait_for_the_probe() -> None:
+    async def scenario() -> None:
+        requester = ResilientRequester(
+            Settings(http_retries=1, circuit_breaker_failure_threshold=1, circuit_breaker_reset_seconds=0)
+        )
+        requester._breaker.record_failure(HOST)
+        release = asyncio.Event()
+
+        async def probe() -> str:
+            await release.wait()
+            return "ok"
+
+        async def unused() -> str:
+            raise AssertionError("sent while the probe was in flight")
+
+        first = asyncio.ensure_future(requester.run(URL, probe))
+        await asyncio.sleep(0)
+        with pytest.raises(CircuitOpenError):
+            await requester.run(URL, unused)
+        release.set()
+        assert await first == "ok"
+        assert await requester.run(URL, probe) == "ok"
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("outcome", ["not-found", "cancelled"])
+def test_probe_without_a_verdict_frees_the_slot(outcome: str) -> None:
+    async def scenario() -> None:
+        requester = ResilientRequester(
+            Settings(http_retries=1, circuit_breaker_failure_threshold=1, circuit_breaker_reset_seconds=0)
+        )
+        requester._breaker.record_failure(HOST)
+
+        async def send() -> str:
+            if outcome == "cancelled":
+                await asyncio.sleep(60)
+            request = httpx.Request("GET", URL)
+            raise httpx.HTTPStatusError("404", request=request, response=httpx.Response(404, request=request))
+
+        task = asyncio.ensure_future(requester.run(URL, send))
+        await asyncio.sleep(0)
+        if outcome == "cancelled":
+            task.cancel()
+        with pytest.raises((httpx.HTTPStatusError, asyncio.CancelledError)):
+            await task
+        assert requester._breaker.allow(HOST)
+
+    asyncio.run(scenario())
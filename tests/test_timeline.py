@@ -0,0 +1,43 @@
+"""Behaviour of ``GameTimeline`` that the pipeline relies on between runs."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from models.game import Announcement, GameTimeline
+
+
+def _announcement(ann_id: int) -> Announcement:
+    return Announcement(
+        id=ann_id,
+        title=f"活动 {ann_id}",
+        description="",
+        game="原神",
+        category="event",
+        start_time=datetime(2026, 11, 19, 11),
+    )
+
+
+def test_injecting_into_an_existing_version_keeps_its_fields() -> None:
+    special_program = datetime(2026, 11, 14, 20)
+    timeline = GameTimeline()
+    timeline.upsert_version(code="9.8", name="星海回响", special_program_time=special_program)
+
+    timeline.inject_announcements(code="9.8", announcements=[_announcement(1)])
+
+    version = timeline.find_version(code="9.8")
+    assert version is not None
+    assert version.special_program_time == special_program
+    assert version.name == "星海回响"
+    assert [announcement.id for announcement in version.announcements] == [1]
+
+
+def test_injecting_into_a_missing_version_creates_it() -> None:
+    timeline = GameTimeline()
+
+    timeline.inject_announcements(code="9.8", announcements=[_announcement(1)])
+
+    version = timeline.find_version(code="9.8")
+    assert version is not None
+    assert [announcement.id for announcement in version.announcements] == [1]
+    assert timeline.changes().added_versions == [version]
@@ -0,0 +1,60 @@
+"""Executor layer for CPU-bound pipeline stages."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Literal, TypeVar
+
+T = TypeVar("T")
+
+ExecutorKind = Literal["process", "thread"]
+
+
+class WorkerPool:
+    """Run blocking callables off the event loop.
+
+    With ``workers=0`` callables run inline on the loop, which keeps the old
+    single-threaded behaviour. Process workers receive their arguments by
+    pickling, so callables must be module-level functions and every argument
+    and return value must be picklable.
+    """
+
+    def __init__(self, *, kind: ExecutorKind, workers: int) -> None:
+        self.kind = kind
+        self.workers = workers
+        self._executor: Executor | None = None
+
+    async def __aenter__(self) -> "WorkerPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.shutdown()
+
+    def _ensure_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                # ``spawn`` avoids forking a process that already runs threads.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix="hoyo-worker",
+                )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        if self.workers == 0:
+            return func(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._ensure_executor(), partial(func, *args))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,73 @@
+"""Atomic, skip-if-unchanged output writes."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Iterable
+
+import aiofiles
+from loguru import logger
+
+
+class FileWriter:
+    """Write output files only when their content changed.
+
+    The rendered bytes are compared with the file on disk; a changed file
+    is written to a sibling temp file and renamed over the target, so
+    readers never see it missing or half written. Counters cover every
+    call made through one writer.
+    """
+
+    def __init__(self) -> None:
+        self.written = 0
+        self.unchanged = 0
+        self.removed = 0
+        self.bytes_written = 0
+
+    async def write(self, path: Path, body: bytes) -> bool:
+        """Write ``body`` to ``path`` unless it already holds it; return whether it wrote."""
+
+        current = None
+        if path.exists():
+            async with aiofiles.open(path, "rb") as handle:
+                current = await handle.read()
+        if current == body:
+            self.unchanged += 1
+            return False
+        tmp_path = _tmp_path(path)
+        async with aiofiles.open(tmp_path, "wb") as handle:
+            await handle.write(body)
+        os.replace(tmp_path, path)
+        self._record_write(path, body)
+        return True
+
+    def remove_stale(self, directory: Path, pattern: str, keep: Iterable[Path]) -> int:
+        """Delete files in ``directory`` matching ``pattern`` that are not in ``keep``."""
+
+        if not directory.is_dir():
+            return 0
+        kept = set(keep)
+        count = 0
+        for path in directory.glob(pattern):
+            if path not in kept:
+                path.unlink()
+                logger.debug("Removed stale file {path}", path=path)
+                count += 1
+        self.removed += count
+        return count
+
+    def summary(self) -> str:
+        return (
+            f"{self.written} file(s) written ({self.bytes_written} bytes), "
+            f"{self.unchanged} unchanged, {self.removed} removed"
+        )
+
+    def _record_write(self, path: Path, body: bytes) -> None:
+        self.written += 1
+        self.bytes_written += len(body)
+        logger.debug("Wrote {path} ({size} bytes)", path=path, size=len(body))
+
+
+def _tmp_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.tmp")